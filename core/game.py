@@ -1,3 +1,11 @@
+import os
+
+# SDL rendering hints must be set before pygame is imported/initialised.
+# Batching merges consecutive render copies into one submit, and the SDL2
+# alpha blitter enables SDL's SIMD blend paths for our SRCALPHA surfaces.
+os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+
 import pygame
 import time
 
@@ -128,7 +136,13 @@ class PrideOfCodeGame:
             # --------------------------
             self.screen.fill((20, 20, 30))    # global background
             self.state_manager.draw(self.screen)
-            pygame.display.flip()
+
+            # Present only what the scene reports as changed
+            dirty_rects = self.state_manager.get_dirty_rects()
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
 
             # --------------------------
             # Framerate cap
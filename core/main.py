@@ -4,8 +4,9 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pygame
+# game sets the SDL rendering hints, so it is imported before pygame
 from game import PrideOfCodeGame
+import pygame
 
 def main():
     pygame.init()
@@ -6,12 +6,17 @@ class State:
     def update(self, dt): pass
     def draw(self, surface): pass
     def handle_event(self, ev): pass
+    def get_dirty_rects(self):
+        """Rects changed by the last draw: None for the whole screen, an
+        empty list when nothing changed."""
+        return None
 
 class StateManager:
     def __init__(self):
         self.states: Dict[str, State] = {}
         self.current: State | None = None
         self.current_name: str | None = None
+        self.full_redraw = True
 
     def register(self, name: str, state: State):
         self.states[name] = state
@@ -22,6 +27,7 @@ class StateManager:
             except Exception: pass
         self.current = self.states.get(name)
         self.current_name = name
+        self.full_redraw = True
         if self.current:
             try: self.current.enter(**params)
             except Exception: pass
@@ -37,3 +43,11 @@ class StateManager:
     def handle_event(self, ev):
         if self.current:
             self.current.handle_event(ev)
+
+    def get_dirty_rects(self):
+        # The first frame after a switch always presents the whole screen
+        rects = self.current.get_dirty_rects() if self.current else None
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return rects
@@ -5,12 +5,20 @@ Pride of Code - Complete Game Implementation
 This is the main game file that consolidates all visual components and game systems.
 """
 
+import os
+
+# SDL rendering hints must be set before pygame is imported/initialised.
+# Batching merges consecutive render copies into one submit, and the SDL2
+# alpha blitter enables SDL's SIMD blend paths for our SRCALPHA surfaces.
+os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+
 import pygame
 import time
 import math
 import random
 import sys
-import os
+from collections import OrderedDict
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
@@ -115,6 +123,17 @@ DARKER_GRAPHITE = ColorPalette.DARKER_GRAPHITE
 # -------------------------------
 # UI Components
 # -------------------------------
+def display_format(surface, alpha=True):
+    """
+    Convert a cached surface to the display pixel format for fast blitting.
+    
+    Surfaces are returned unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
 class UIComponent:
     """Base class for all UI components."""
     
@@ -127,6 +146,11 @@ class UIComponent:
         """Draw the component on the given surface."""
         pass
     
+    def get_blits(self):
+        """Return (surface, position) pairs that draw the component, for
+        scenes that batch all their widgets into one blits call."""
+        return []
+    
     def handle_event(self, event):
         """Handle pygame events."""
         pass
@@ -156,44 +180,61 @@ class RetroButton(UIComponent):
         self.pressed_offset = 0
         self.glow_alpha = 0
         
+        # Button faces keyed by pressed state, and the rendered text
+        self.faces = {}
+        self.label = None
+        self.label_text = None
+        
     def set_click_callback(self, callback):
         """Set the function to call when button is clicked."""
         self.click_callback = callback
     
-    def draw(self, surface):
-        """Draw the button with appropriate styling based on state."""
+    def _get_face(self, pressed):
+        """Return the button body, border and highlight for a state."""
+        face = self.faces.get(pressed)
+        if face is None:
+            if pressed:
+                button_color = ColorPalette.adjust_brightness(DEEP_SIGNAL_BLUE, 0.9)
+            else:
+                button_color = DEEP_SIGNAL_BLUE
+            
+            face = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            face_rect = face.get_rect()
+            
+            # Draw main button
+            pygame.draw.rect(face, button_color, face_rect, border_radius=4)
+            
+            # Draw border
+            pygame.draw.rect(face, SILVER_STEEL, face_rect, 2, border_radius=4)
+            
+            # Draw inner highlight for normal/hover states
+            if not pressed:
+                highlight_rect = pygame.Rect(1, 1, face_rect.width - 2, 2)
+                pygame.draw.rect(face, RETRO_PIXEL_AMBER, highlight_rect)
+            
+            face = display_format(face)
+            self.faces[pressed] = face
+        return face
+    
+    def _get_label(self):
+        """Return the rendered button text, re-rendered when the text changes."""
+        if self.label_text != self.text:
+            self.label = self.font.render(self.text, True, SILVER_STEEL)
+            self.label_text = self.text
+        return self.label
+    
+    def get_blits(self):
+        """Return the (surface, position) pairs that draw the button."""
         if not self.visible:
-            return
+            return []
             
         # Calculate button position with pressed offset
-        draw_rect = self.rect.copy()
-        draw_rect.y += self.pressed_offset
-        
-        # Draw button background based on state
-        if self.state == "pressed":
-            button_color = ColorPalette.adjust_brightness(DEEP_SIGNAL_BLUE, 0.9)
-        elif self.state == "hover":
-            button_color = DEEP_SIGNAL_BLUE
-        else:
-            button_color = DEEP_SIGNAL_BLUE
-            
-        # Draw main button
-        pygame.draw.rect(surface, button_color, draw_rect, border_radius=4)
+        draw_rect = self.rect.move(0, self.pressed_offset)
         
-        # Draw border
-        pygame.draw.rect(surface, SILVER_STEEL, draw_rect, 2, border_radius=4)
-        
-        # Draw inner highlight for normal/hover states
-        if self.state != "pressed":
-            highlight_rect = pygame.Rect(
-                draw_rect.x + 1, 
-                draw_rect.y + 1, 
-                draw_rect.width - 2, 
-                2
-            )
-            pygame.draw.rect(surface, RETRO_PIXEL_AMBER, highlight_rect)
+        # Button body for the current state
+        blits = [(self._get_face(self.state == "pressed"), draw_rect)]
         
-        # Draw glow effect for hover state
+        # Glow effect for hover state
         if self.state == "hover" and self.glow_alpha > 0:
             glow_surf = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
             glow_color = pygame.Color(NEON_COMPETENCE_CYAN.r, NEON_COMPETENCE_CYAN.g, 
@@ -201,13 +242,17 @@ class RetroButton(UIComponent):
             pygame.draw.rect(glow_surf, glow_color, 
                            pygame.Rect(0, 0, draw_rect.width, draw_rect.height), 
                            border_radius=4)
-            surface.blit(glow_surf, draw_rect)
+            blits.append((glow_surf, draw_rect))
         
-        # Draw text
+        # Text
         if self.text:
-            text_surf = self.font.render(self.text, True, SILVER_STEEL)
-            text_rect = text_surf.get_rect(center=draw_rect.center)
-            surface.blit(text_surf, text_rect)
+            text_surf = self._get_label()
+            blits.append((text_surf, text_surf.get_rect(center=draw_rect.center)))
+        return blits
+    
+    def draw(self, surface):
+        """Draw the button with appropriate styling based on state."""
+        surface.blits(self.get_blits(), doreturn=False)
     
     def handle_event(self, event):
         """Handle mouse events for button interaction."""
@@ -360,6 +405,9 @@ class TextRenderer:
     Section 3. Typography Specification
     """
     
+    # Number of rendered surfaces kept, least recently used dropped first
+    CACHE_SIZE = 128
+    
     def __init__(self):
         # In a real implementation, you would load pixel fonts here
         self.fonts = {
@@ -368,11 +416,15 @@ class TextRenderer:
             'large': pygame.font.Font(None, 22),
             'title': pygame.font.Font(None, 32)
         }
+        self.cache = OrderedDict()
     
     def render_text(self, text, style='medium', color=SILVER_STEEL, outline=False):
         """
         Render text with optional outline.
         
+        Rendered surfaces are cached and shared between calls, so callers
+        must not draw onto them.
+        
         Args:
             text: String to render
             style: Font style ('small', 'medium', 'large', 'title')
@@ -382,6 +434,19 @@ class TextRenderer:
         Returns:
             pygame.Surface with rendered text
         """
+        key = (text, style, tuple(color), outline)
+        text_surface = self.cache.get(key)
+        if text_surface is None:
+            text_surface = self._render(text, style, color, outline)
+            self.cache[key] = text_surface
+            if len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return text_surface
+    
+    def _render(self, text, style, color, outline):
+        """Render text without consulting the cache."""
         font = self.fonts.get(style, self.fonts['medium'])
         
         if outline:
@@ -392,10 +457,10 @@ class TextRenderer:
             )
             
             # Draw outline in background color
+            outline_text = font.render(text, True, SILVER_STEEL)
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
-                        outline_text = font.render(text, True, SILVER_STEEL)
                         outline_surface.blit(outline_text, (dx + 1, dy + 1))
             
             # Draw main text in center
@@ -655,6 +720,11 @@ class MainMenuScene(Scene):
         self.star_timer = 0
         self.star_visible = False
         
+        # The gradient, crowd and star never change, so render them once
+        self.background_surface = self._create_background()
+        self.crowd_strip = self._create_crowd_strip()
+        self.star_surface = self._create_star()
+        
         self._create_buttons()
     
     def _create_buttons(self):
@@ -728,33 +798,84 @@ class MainMenuScene(Scene):
         pygame.quit()
         sys.exit()
     
-    def _draw_background(self, surface):
-        """Draw the gradient background with crowd silhouettes."""
-        # Draw gradient background
+    def _create_background(self):
+        """Render the vertical gradient background to a surface.
+
+        The row colors are packed into a one pixel wide RGB column, which a
+        single scale call stretches across the screen width.
+        """
+        column = bytearray()
         for y in range(self.screen_height):
             # Calculate interpolation factor
             factor = y / self.screen_height
             r = int(self.bottom_color.r * (1 - factor) + self.top_color.r * factor)
             g = int(self.bottom_color.g * (1 - factor) + self.top_color.g * factor)
             b = int(self.bottom_color.b * (1 - factor) + self.top_color.b * factor)
-            
-            pygame.draw.line(surface, (r, g, b), (0, y), (self.screen_width, y))
+            column += bytes((r, g, b))
         
-        # Draw crowd silhouettes (simplified implementation)
+        column_surface = pygame.image.frombuffer(bytes(column), (1, self.screen_height), 'RGB')
+        background = pygame.transform.scale(column_surface, (self.screen_width, self.screen_height))
+        return display_format(background, alpha=False)
+    
+    def _create_crowd_strip(self):
+        """
+        Render one scroll period of crowd silhouettes.
+        
+        The strip is one screen width plus one crowd spacing wide, so two
+        copies side by side cover the screen at any scroll offset.
+        """
         crowd_color = pygame.Color(0, 0, 0, int(255 * 0.1))  # 10% opacity
-        crowd_surface = pygame.Surface((self.screen_width, 50), pygame.SRCALPHA)
+        crowd_surface = pygame.Surface((220, 50), pygame.SRCALPHA)
         pygame.draw.ellipse(crowd_surface, crowd_color, (0, 0, 100, 30))
         pygame.draw.ellipse(crowd_surface, crowd_color, (50, 10, 80, 25))
         pygame.draw.ellipse(crowd_surface, crowd_color, (100, 5, 120, 35))
         
-        # Draw crowd at multiple positions
+        # Crowds every 200 pixels
+        crowd_strip = pygame.Surface((self.screen_width + 200, 50), pygame.SRCALPHA)
         for i in range(5):
-            x_pos = (i * 200 + self.crowd_offset) % (self.screen_width + 200) - 100
-            surface.blit(crowd_surface, (x_pos, self.screen_height - 100))
+            crowd_strip.blit(crowd_surface, (i * 200, 0))
+        return display_format(crowd_strip)
     
-    def _draw_logo(self, surface):
-        """Draw the game logo with star animation."""
-        # Draw "Pride of Code" text with outline
+    def _create_star(self):
+        """Render the 8-bit logo star.
+
+        The surface origin sits at (+88, -27) from the logo center, leaving
+        room for the 2px line width around the star points.
+        """
+        star_surface = pygame.Surface((25, 15), pygame.SRCALPHA)
+        star_points = [
+            (12, 2),   # Top
+            (17, 7),   # Top-right
+            (22, 2),   # Right
+            (17, 7),   # Back to top-right
+            (22, 12),  # Bottom-right
+            (17, 7),   # Back to top-right
+            (12, 12),  # Bottom
+            (17, 7),   # Back to top-right
+            (7, 12),   # Bottom-left
+            (17, 7),   # Back to top-right
+            (2, 2),    # Left
+            (17, 7),   # Back to top-right
+            (7, 7),    # Top-left
+        ]
+        pygame.draw.lines(star_surface, SILVER_STEEL, False, star_points, 2)
+        return display_format(star_surface)
+    
+    def _add_background_blits(self, blits):
+        """Add the gradient background and crowd silhouettes to a blit list."""
+        # Gradient background
+        blits.append((self.background_surface, (0, 0)))
+        
+        # Crowd silhouettes, scrolled by wrapping two copies of the strip
+        strip_width = self.crowd_strip.get_width()
+        x_pos = self.crowd_offset % strip_width - 100
+        crowd_y = self.screen_height - 100
+        blits.append((self.crowd_strip, (x_pos - strip_width, crowd_y)))
+        blits.append((self.crowd_strip, (x_pos, crowd_y)))
+    
+    def _add_logo_blits(self, blits):
+        """Add the game logo with star animation to a blit list."""
+        # "Pride of Code" text with outline
         logo_text = self.text_renderer.render_text(
             "PRIDE OF CODE", 
             style='title', 
@@ -762,7 +883,7 @@ class MainMenuScene(Scene):
             outline=True
         )
         logo_rect = logo_text.get_rect(center=(self.screen_width // 2, 150))
-        surface.blit(logo_text, logo_rect)
+        blits.append((logo_text, logo_rect))
         
         # Draw star animation
         self.star_timer += 1
@@ -779,24 +900,8 @@ class MainMenuScene(Scene):
                 self.animation_manager.add_animation(sparkle)
         
         if self.star_visible:
-            # Draw simple 8-bit star
-            star_points = [
-                (logo_rect.centerx + 100, logo_rect.centery - 25),  # Top
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Top-right
-                (logo_rect.centerx + 110, logo_rect.centery - 25),  # Right
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 110, logo_rect.centery - 15),  # Bottom-right
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 100, logo_rect.centery - 15),  # Bottom
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 95, logo_rect.centery - 15),   # Bottom-left
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 90, logo_rect.centery - 25),   # Left
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 95, logo_rect.centery - 20),   # Top-left
-            ]
-            
-            pygame.draw.lines(surface, SILVER_STEEL, False, star_points, 2)
+            # Simple 8-bit star
+            blits.append((self.star_surface, (logo_rect.centerx + 88, logo_rect.centery - 27)))
     
     def handle_event(self, event):
         """Handle pygame events."""
@@ -817,15 +922,13 @@ class MainMenuScene(Scene):
     
     def draw(self, surface):
         """Draw the main menu scene."""
-        # Draw background
-        self._draw_background(surface)
-        
-        # Draw logo
-        self._draw_logo(surface)
-        
-        # Draw buttons
+        # Background, logo and buttons, drawn in one batch
+        blits = []
+        self._add_background_blits(blits)
+        self._add_logo_blits(blits)
         for button in self.buttons:
-            button.draw(surface)
+            blits.extend(button.get_blits())
+        surface.blits(blits, doreturn=False)
         
         # Draw animations
         self.animation_manager.draw(surface)
@@ -1150,6 +1253,8 @@ class LevelSelectScene(Scene):
                 
                 tile = LevelTile(x, y, self.tile_width, self.tile_height, index + 1)
                 self.tiles.append(tile)
+        
+        self.tile_blits = [(tile.static_surface, tile.rect) for tile in self.tiles]
     
     def _on_back_clicked(self):
         """Handle back button click."""
@@ -1174,18 +1279,48 @@ class LevelSelectScene(Scene):
     
     def draw(self, surface):
         """Draw the level select scene."""
-        # Draw title
-        title_font = self.text_renderer.fonts['title']
-        title = title_font.render("WEEK SELECT", True, GOLD_EXCELLENCE)
+        # Title
+        title = self.text_renderer.render_text("WEEK SELECT", style='title', color=GOLD_EXCELLENCE)
         title_rect = title.get_rect(center=(self.screen_width // 2, 50))
-        surface.blit(title, title_rect)
+        blits = [(title, title_rect)]
         
-        # Draw back button
-        self.back_button.draw(surface)
+        # Back button
+        blits.extend(self.back_button.get_blits())
         
-        # Draw level tiles
+        # Level tiles: all static bodies, then the hover and confetti
+        # overlays (tiles never overlap)
+        blits.extend(self.tile_blits)
         for tile in self.tiles:
-            tile.draw(surface)
+            blits.extend(tile.get_overlay_blits())
+        
+        # Draw the whole scene in one batch
+        surface.blits(blits, doreturn=False)
+
+
+# Tile colors, computed once as plain tuples
+_LOCKED_TILE_COLOR = (0, 0, 0, int(255 * 0.5))  # Semi-transparent black
+_WEEK_TILE_COLOR = (  # Dimmed Stadium Turf Green (70%)
+    int(STADIUM_TURF_GREEN.r * 0.7),
+    int(STADIUM_TURF_GREEN.g * 0.7),
+    int(STADIUM_TURF_GREEN.b * 0.7)
+)
+_HOVER_COLOR = (67, 224, 236, int(255 * 0.2))  # NEON_COMPETENCE_CYAN with 20% alpha
+_CONFETTI_COLORS = (GOLD_EXCELLENCE, PRECISION_MAGENTA, STADIUM_TURF_GREEN)
+
+# Confetti particle surfaces shared by every tile, keyed by (color, size)
+_PARTICLE_CACHE = {}
+
+
+def _get_particle_surface(color, size):
+    """Return the cached solid square surface for a confetti particle."""
+    key = (tuple(color), size)
+    particle_surf = _PARTICLE_CACHE.get(key)
+    if particle_surf is None:
+        particle_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        particle_surf.fill(color)
+        particle_surf = display_format(particle_surf)
+        _PARTICLE_CACHE[key] = particle_surf
+    return particle_surf
 
 
 class LevelTile(UIComponent):
@@ -1196,6 +1331,13 @@ class LevelTile(UIComponent):
     Section 5.2 Level Select / Week Planner - Tile Design
     """
     
+    # Fonts and lock icon shared by every tile, created by the first tile
+    number_font = None
+    lock_icon = None
+    
+    # Hover highlight surfaces shared by every tile, keyed by tile size
+    hover_surfaces = {}
+    
     def __init__(self, x, y, width, height, week_number):
         super().__init__(x, y, width, height)
         self.week_number = week_number
@@ -1203,9 +1345,83 @@ class LevelTile(UIComponent):
         self.is_competition = week_number % 3 == 0  # Every 3rd week is competition
         self.hovered = False
         
-        # Animation properties
+        # Animation properties; each tile seeds its own generator so confetti
+        # varies between tiles but stays reproducible
         self.confetti_particles = []
         self.confetti_timer = 0
+        self.rng = random.Random(week_number)
+        
+        # Background, border, badge and lock never change, so draw them once
+        self._load_shared_assets()
+        self.static_surface = self._create_static_surface()
+    
+    @classmethod
+    def _load_shared_assets(cls):
+        """Create the tile fonts and lock icon the first time they are needed."""
+        if cls.number_font is None:
+            cls.number_font = pygame.font.Font(None, 24)
+            lock_font = pygame.font.Font(None, 32)
+            cls.lock_icon = lock_font.render("🔒", True, PRECISION_MAGENTA)
+    
+    def _create_static_surface(self):
+        """Render the static tile body (everything but hover and confetti)."""
+        # Determine tile colors based on type
+        if self.is_locked:
+            background_color = _LOCKED_TILE_COLOR
+            border_color = SILVER_STEEL
+        elif self.is_competition:
+            background_color = DEEP_SIGNAL_BLUE
+            border_color = GOLD_EXCELLENCE
+        else:
+            background_color = _WEEK_TILE_COLOR
+            border_color = SILVER_STEEL
+        
+        # The background covers the whole tile, so the surface needs no
+        # per-pixel alpha (drawing on the screen ignored the color alpha too)
+        static = pygame.Surface(self.rect.size)
+        tile_rect = static.get_rect()
+        
+        # Draw tile background
+        pygame.draw.rect(static, background_color, tile_rect)
+        
+        # Draw border
+        pygame.draw.rect(static, border_color, tile_rect, 2)
+        
+        # Draw week number badge
+        badge_radius = 15
+        badge_center = (tile_rect.centerx, 20)
+        pygame.draw.circle(static, GOLD_EXCELLENCE, badge_center, badge_radius)
+        pygame.draw.circle(static, SILVER_STEEL, badge_center, badge_radius, 2)
+        
+        # Draw week number
+        week_text = self.number_font.render(str(self.week_number), True, DARK_GRAPHITE_BLACK)
+        week_rect = week_text.get_rect(center=badge_center)
+        static.blit(week_text, week_rect)
+        
+        # Draw lock icon for locked weeks
+        if self.is_locked:
+            lock_rect = self.lock_icon.get_rect(center=tile_rect.center)
+            static.blit(self.lock_icon, lock_rect)
+            
+            # Draw semi-transparent overlay
+            overlay = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, int(255 * 0.5)))  # 50% transparent black
+            static.blit(overlay, (0, 0))
+        
+        return display_format(static, alpha=False)
+    
+    def _get_hover_surface(self):
+        """Return the shared hover highlight for this tile's size."""
+        size = self.rect.size
+        highlight_surf = self.hover_surfaces.get(size)
+        if highlight_surf is None:
+            highlight_surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(highlight_surf, _HOVER_COLOR, 
+                           pygame.Rect(0, 0, self.rect.width, self.rect.height), 
+                           border_radius=2)
+            highlight_surf = display_format(highlight_surf)
+            self.hover_surfaces[size] = highlight_surf
+        return highlight_surf
     
     def handle_event(self, event):
         """Handle mouse events for the tile."""
@@ -1225,11 +1441,15 @@ class LevelTile(UIComponent):
             if self.confetti_timer >= 0.2:  # Add particle every 0.2 seconds
                 self.confetti_timer = 0
                 if len(self.confetti_particles) < 20:  # Limit particles
+                    rng = self.rng
+                    color = rng.choice(_CONFETTI_COLORS)
+                    size = rng.randint(1, 3)
                     particle = {
-                        'x': self.rect.x + pygame.time.get_ticks() % self.rect.width,
-                        'y': self.rect.y + pygame.time.get_ticks() % self.rect.height,
-                        'color': [GOLD_EXCELLENCE, PRECISION_MAGENTA, STADIUM_TURF_GREEN][pygame.time.get_ticks() % 3],
-                        'size': pygame.time.get_ticks() % 3 + 1,
+                        'x': self.rect.x + rng.randrange(self.rect.width),
+                        'y': self.rect.y + rng.randrange(self.rect.height),
+                        'color': color,
+                        'size': size,
+                        'surf': _get_particle_surface(color, size),
                         'lifetime': 1.0
                     }
                     self.confetti_particles.append(particle)
@@ -1242,67 +1462,25 @@ class LevelTile(UIComponent):
     
     def draw(self, surface):
         """Draw the level tile."""
-        # Determine tile colors based on type
-        if self.is_locked:
-            background_color = pygame.Color(0, 0, 0, int(255 * 0.5))  # Semi-transparent black
-            border_color = SILVER_STEEL
-        elif self.is_competition:
-            background_color = DEEP_SIGNAL_BLUE
-            border_color = GOLD_EXCELLENCE
-        else:
-            # Dimmed Stadium Turf Green (70%)
-            background_color = pygame.Color(
-                int(STADIUM_TURF_GREEN.r * 0.7),
-                int(STADIUM_TURF_GREEN.g * 0.7),
-                int(STADIUM_TURF_GREEN.b * 0.7)
-            )
-            border_color = SILVER_STEEL
-        
-        # Draw tile background
-        pygame.draw.rect(surface, background_color, self.rect)
-        
-        # Draw border
-        pygame.draw.rect(surface, border_color, self.rect, 2)
-        
-        # Draw week number badge
-        badge_radius = 15
-        badge_center = (self.rect.centerx, self.rect.y + 20)
-        pygame.draw.circle(surface, GOLD_EXCELLENCE, badge_center, badge_radius)
-        pygame.draw.circle(surface, SILVER_STEEL, badge_center, badge_radius, 2)
-        
-        # Draw week number
-        font = pygame.font.Font(None, 24)
-        week_text = font.render(str(self.week_number), True, DARK_GRAPHITE_BLACK)
-        week_rect = week_text.get_rect(center=badge_center)
-        surface.blit(week_text, week_rect)
-        
-        # Draw lock icon for locked weeks
-        if self.is_locked:
-            lock_font = pygame.font.Font(None, 32)
-            lock_text = lock_font.render("🔒", True, PRECISION_MAGENTA)
-            lock_rect = lock_text.get_rect(center=self.rect.center)
-            surface.blit(lock_text, lock_rect)
-            
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, int(255 * 0.5)))  # 50% transparent black
-            surface.blit(overlay, self.rect)
+        surface.blits(self.get_blits(), doreturn=False)
+    
+    def get_blits(self):
+        """Return the (surface, position) pairs that draw the tile."""
+        return [(self.static_surface, self.rect)] + self.get_overlay_blits()
+    
+    def get_overlay_blits(self):
+        """Return the blits of the animated parts drawn over the static body."""
+        blits = []
         
-        # Draw hover effect
+        # Hover effect
         if self.hovered and not self.is_locked:
-            highlight_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            highlight_color = pygame.Color(67, 224, 236, int(255 * 0.2))  # NEON_COMPETENCE_CYAN with 20% alpha
-            pygame.draw.rect(highlight_surf, highlight_color, 
-                           pygame.Rect(0, 0, self.rect.width, self.rect.height), 
-                           border_radius=2)
-            surface.blit(highlight_surf, self.rect)
+            blits.append((self._get_hover_surface(), self.rect))
         
-        # Draw confetti for competition weeks
+        # Confetti for competition weeks
         if self.is_competition and not self.is_locked:
-            for particle in self.confetti_particles:
-                s = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-                s.fill(particle['color'])
-                surface.blit(s, (particle['x'], particle['y']))
+            blits.extend((particle['surf'], (particle['x'], particle['y']))
+                         for particle in self.confetti_particles)
+        return blits
 
 
 # -------------------------------
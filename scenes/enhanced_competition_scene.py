@@ -669,10 +669,13 @@ class EnhancedCompetitionScene(State):
             
     def _draw_stadium(self, surface):
         """Draw stadium background elements."""
-        # Sky gradient
-        for y in range(WINDOW_HEIGHT // 3):
-            color = (135 - y // 6, 206 - y // 6, 235 - y // 6)
-            pygame.draw.line(surface, color, (0, y), (WINDOW_WIDTH, y))
+        # Sky gradient; the shade only changes every 6 rows, so fill each
+        # band of identical rows at once
+        sky_height = WINDOW_HEIGHT // 3
+        for y in range(0, sky_height, 6):
+            shade = y // 6
+            surface.fill((135 - shade, 206 - shade, 235 - shade),
+                         (0, y, WINDOW_WIDTH, min(6, sky_height - y)))
             
         # Draw stadium tiers
         for tier in self.stadium_tiers:
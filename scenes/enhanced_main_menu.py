@@ -13,6 +13,9 @@ from config import (WINDOW_WIDTH, WINDOW_HEIGHT, COLOR_BLUE, COLOR_GOLD,
                    COLOR_TEXT, COLOR_BG)
 from ui.enhanced_retro_button import EnhancedRetroButton, AnimatedPixelButton
 
+# Minimum frames between menu chimes (~100ms at 60 FPS) to prevent sound spam
+CHIME_DEBOUNCE_FRAMES = 6
+
 
 class EnhancedMainMenu(State):
     """Enhanced main menu with comprehensive retro-pixel design and animations."""
@@ -58,22 +61,31 @@ class EnhancedMainMenu(State):
         # Animation states
         self.title_animation = 0.0
         self.background_animation = 0.0
-        self.pixel_marchers = []
         self._create_marchers()
         
         # Sound system (8-bit chimes)
         self.sound_enabled = True
-        self.last_sound_time = 0
+        self.frame_count = 0
+        self.last_chime_frame = -CHIME_DEBOUNCE_FRAMES
         
         # Particle effects for celebration
         self.particles = []
         
+        # Sprite caches and reusable blit lists for the per-frame batches
+        self.marcher_sprites = {}
+        self.leg_sprites = {}
+        self.particle_sprites = {}
+        self.marcher_blit_buf = []
+        self.particle_blit_buf = []
+        
         # Menu state
         self.current_selection = 0
         self.animation_intensity = 0
         
         # Retro bowl elements
         self._create_stadium_elements()
+        self._create_static_layer()
+        self._create_pride_surfaces()
         
     def _create_buttons(self):
         """Create main menu buttons with retro styling."""
@@ -90,35 +102,35 @@ class EnhancedMainMenu(State):
                 "START SEASON", 
                 color=self.colors['brass'],
                 animation_type="pulse",
-                on_click=lambda: self._navigate_to_level_select()
+                on_click=self._navigate_to_level_select
             ),
             AnimatedPixelButton(
                 button_x, start_y + spacing, button_width, button_height,
                 "CONTINUE",
                 color=self.colors['accent'],
                 animation_type="march",
-                on_click=lambda: self._navigate_to_continue()
+                on_click=self._navigate_to_continue
             ),
             AnimatedPixelButton(
                 button_x, start_y + spacing * 2, button_width, button_height,
                 "SETTINGS",
                 color=(100, 100, 100),
                 animation_type="sparkle",
-                on_click=lambda: self._navigate_to_settings()
+                on_click=self._navigate_to_settings
             ),
             AnimatedPixelButton(
                 button_x, start_y + spacing * 3, button_width, button_height,
                 "ABOUT",
                 color=(60, 60, 60),
                 animation_type="pulse",
-                on_click=lambda: self._navigate_to_about()
+                on_click=self._navigate_to_about
             ),
             AnimatedPixelButton(
                 button_x, start_y + spacing * 4, button_width, button_height,
                 "QUIT",
                 color=(120, 40, 40),
                 animation_type="sparkle",
-                on_click=lambda: self._quit_game()
+                on_click=self._quit_game
             )
         ]
         
@@ -128,17 +140,25 @@ class EnhancedMainMenu(State):
             self.buttons[0].set_focused(True)
             
     def _create_marchers(self):
-        """Create pixel art marching band members for background animation."""
+        """Create pixel art marching band members for background animation.
+
+        Marchers are stored as parallel lists, one per attribute, so the
+        per-frame update only walks positions and speeds.
+        """
+        rainbow = self.colors['rainbow']
+        self.marcher_x = []
+        self.marcher_y = []
+        self.marcher_speed = []
+        self.marcher_color = []
+        self.marcher_instrument = []
+        self.marcher_size = []
         for i in range(12):
-            marcher = {
-                'x': -100 - (i * 60),  # Start off-screen
-                'y': 180 + (i % 3) * 25,  # Alternating heights
-                'speed': 1.0 + random.random() * 0.5,
-                'color': self.colors['rainbow'][i % len(self.colors['rainbow'])],
-                'instrument': random.choice(['trumpet', 'drum', 'flute', 'sax', 'flag']),
-                'size': 8 + random.randint(0, 4)
-            }
-            self.pixel_marchers.append(marcher)
+            self.marcher_x.append(-100 - (i * 60))  # Start off-screen
+            self.marcher_y.append(180 + (i % 3) * 25)  # Alternating heights
+            self.marcher_speed.append(1.0 + random.random() * 0.5)
+            self.marcher_color.append(rainbow[i % len(rainbow)])
+            self.marcher_instrument.append(random.choice(['trumpet', 'drum', 'flute', 'sax', 'flag']))
+            self.marcher_size.append(8 + random.randint(0, 4))
             
     def _create_stadium_elements(self):
         """Create stadium background elements for retro bowl theme."""
@@ -158,15 +178,55 @@ class EnhancedMainMenu(State):
         for i in range(0, WINDOW_WIDTH, 40):
             self.field_lines.append(i)
             
+    def _create_static_layer(self):
+        """Pre-render the stadium silhouette and field, which never change.
+
+        Only the bounding box of the static artwork is kept, so drawing the
+        whole layer each frame is a single small blit.
+        """
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self._draw_stadium_silhouette(layer)
+        self._draw_field(layer)
+        
+        self.static_layer_rect = pygame.Rect(100, WINDOW_HEIGHT - 250,
+                                             WINDOW_WIDTH - 199, 171)
+        self.static_layer = layer.subsurface(self.static_layer_rect).copy()
+            
+    def _create_pride_surfaces(self):
+        """Pre-render the rainbow banner and the small pride flag decoration."""
+        rainbow = self.colors['rainbow']
+        
+        # Rainbow banner below the title (stripes inside a 2px brass border)
+        banner_height = 8
+        self.banner_pos = (WINDOW_WIDTH // 2 - 202, 198)
+        self.banner_surf = pygame.Surface((404, banner_height + 4), pygame.SRCALPHA)
+        stripe_width = 400 // len(rainbow)
+        for i, color in enumerate(rainbow):
+            pygame.draw.rect(self.banner_surf, color,
+                             (2 + i * stripe_width, 2, stripe_width + 1, banner_height))
+        pygame.draw.rect(self.banner_surf, self.colors['brass'],
+                         (0, 0, 404, banner_height + 4), 2)
+        
+        # Small pride flag with its pole; blitted at each flag position
+        self.flag_surf = pygame.Surface((22, 40), pygame.SRCALPHA)
+        for i, color in enumerate(rainbow):
+            pygame.draw.rect(self.flag_surf, color, (2, 10 + i * 4, 20, 4))
+        pygame.draw.rect(self.flag_surf, (100, 100, 100), (0, 0, 2, 40))
+        
+        flag_positions = [
+            (100, 250), (WINDOW_WIDTH - 100, 250),
+            (100, WINDOW_HEIGHT - 150), (WINDOW_WIDTH - 100, WINDOW_HEIGHT - 150)
+        ]
+        self.flag_blits = [(self.flag_surf, (x - 2, y - 10)) for x, y in flag_positions]
+            
     def _play_chime(self, frequency=440):
         """Play 8-bit chime sound (placeholder for actual audio implementation)."""
-        # This would integrate with the actual audio system
-        # For now, just print to indicate sound would play
+        # This would integrate with the actual audio system; until then only
+        # the debounce state is tracked. Debouncing on the frame counter keeps
+        # key-repeat storms from hitting SDL's clock.
         if self.sound_enabled:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_sound_time > 100:  # Prevent sound spam
-                print(f"\u266a 8-bit chime at {frequency}Hz")
-                self.last_sound_time = current_time
+            if self.frame_count - self.last_chime_frame >= CHIME_DEBOUNCE_FRAMES:
+                self.last_chime_frame = self.frame_count
                 
     def _navigate_to_level_select(self):
         """Navigate to level select screen."""
@@ -221,8 +281,7 @@ class EnhancedMainMenu(State):
                 self._play_chime(440)
                 
             elif ev.key == pygame.K_RETURN or ev.key == pygame.K_SPACE:
-                if self.buttons[self.current_selection].on_click:
-                    self.buttons[self.current_selection].on_click()
+                self.buttons[self.current_selection].on_click()
                     
             elif ev.key == pygame.K_ESCAPE:
                 self._quit_game()
@@ -256,6 +315,8 @@ class EnhancedMainMenu(State):
             
     def update(self, dt):
         """Update animations and effects."""
+        self.frame_count += 1
+        
         # Update title animation
         self.title_animation += dt * 2
         
@@ -263,13 +324,22 @@ class EnhancedMainMenu(State):
         self.background_animation += dt
         
         # Update pixel marchers
-        for marcher in self.pixel_marchers:
-            marcher['x'] += marcher['speed']
-            if marcher['x'] > WINDOW_WIDTH + 100:
-                marcher['x'] = -100 - random.randint(0, 200)
-                marcher['y'] = 180 + random.randint(-20, 40)
-                marcher['color'] = random.choice(self.colors['rainbow'])
-                marcher['instrument'] = random.choice(['trumpet', 'drum', 'flute', 'sax', 'flag'])
+        marcher_x = self.marcher_x
+        for i, speed in enumerate(self.marcher_speed):
+            marcher_x[i] += speed
+            
+        # Wrap marchers that left the screen (rare, so checked once up front)
+        wrap_x = WINDOW_WIDTH + 100
+        if max(marcher_x) > wrap_x:
+            randint = random.randint
+            choice = random.choice
+            rainbow = self.colors['rainbow']
+            for i, x in enumerate(marcher_x):
+                if x > wrap_x:
+                    marcher_x[i] = -100 - randint(0, 200)
+                    self.marcher_y[i] = 180 + randint(-20, 40)
+                    self.marcher_color[i] = choice(rainbow)
+                    self.marcher_instrument[i] = choice(['trumpet', 'drum', 'flute', 'sax', 'flag'])
                 
         # Update buttons
         for button in self.buttons:
@@ -286,17 +356,22 @@ class EnhancedMainMenu(State):
         
     def _update_particles(self, dt):
         """Update particle effects."""
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        
         # Update existing particles
+        expired = False
+        gravity = 200 * dt
         for particle in self.particles:
             particle['x'] += particle['vx'] * dt
             particle['y'] += particle['vy'] * dt
-            particle['vy'] += 200 * dt  # Gravity
+            particle['vy'] += gravity
             particle['life'] -= dt
             particle['rotation'] += particle['rotation_speed'] * dt
-            
+            if particle['life'] <= 0:
+                expired = True
+
+        # Remove dead particles (only rebuild the list when one expired)
+        if expired:
+            self.particles = [p for p in self.particles if p['life'] > 0]
+
         # Occasionally create new particles for ambient effect
         if random.random() < 0.03:
             self._create_particle(WINDOW_WIDTH // 2, 100)
@@ -332,7 +407,7 @@ class EnhancedMainMenu(State):
         
         # Draw animated elements
         self._draw_stadium_background(surface)
-        self._draw_field(surface)
+        surface.blit(self.static_layer, self.static_layer_rect)
         self._draw_marchers(surface)
         self._draw_particles(surface)
         
@@ -352,10 +427,12 @@ class EnhancedMainMenu(State):
         
         # Animated pixel grid
         grid_offset = int(self.background_animation * 20) % 40
+        draw_rect = pygame.draw.rect
+        grid_rows = range(-40, WINDOW_HEIGHT + 40, 40)
         for x in range(-40, WINDOW_WIDTH + 40, 40):
-            for y in range(-40, WINDOW_HEIGHT + 40, 40):
+            for y in grid_rows:
                 if (x + y + grid_offset) % 80 == 0:
-                    pygame.draw.rect(surface, (30, 30, 40), (x, y, 2, 2))
+                    draw_rect(surface, (30, 30, 40), (x, y, 2, 2))
                     
     def _draw_stadium_background(self, surface):
         """Draw stadium background with tiers."""
@@ -369,9 +446,6 @@ class EnhancedMainMenu(State):
             )
             pygame.draw.rect(surface, tier['color'], tier_rect)
             
-        # Draw stadium details
-        self._draw_stadium_silhouette(surface)
-        
     def _draw_stadium_silhouette(self, surface):
         """Draw stadium silhouette in background."""
         # Simple stadium shape
@@ -400,64 +474,139 @@ class EnhancedMainMenu(State):
         pygame.draw.rect(surface, self.colors['field_green'], field_rect)
         
         # Field lines
+        draw_line = pygame.draw.line
+        right_edge = WINDOW_WIDTH - 150
+        top = WINDOW_HEIGHT - 160
+        bottom = WINDOW_HEIGHT - 110
         for x in self.field_lines:
-            if 150 <= x <= WINDOW_WIDTH - 150:
-                pygame.draw.line(surface, (255, 255, 255), (x, WINDOW_HEIGHT - 160), (x, WINDOW_HEIGHT - 110), 1)
+            if 150 <= x <= right_edge:
+                draw_line(surface, (255, 255, 255), (x, top), (x, bottom), 1)
                 
         # Yard markers
         for i in range(0, WINDOW_WIDTH, 100):
-            if 150 <= i <= WINDOW_WIDTH - 150:
-                pygame.draw.line(surface, (255, 255, 255), (i, WINDOW_HEIGHT - 160), (i, WINDOW_HEIGHT - 155), 2)
-                pygame.draw.line(surface, (255, 255, 255), (i, WINDOW_HEIGHT - 115), (i, WINDOW_HEIGHT - 110), 2)
+            if 150 <= i <= right_edge:
+                draw_line(surface, (255, 255, 255), (i, top), (i, top + 5), 2)
+                draw_line(surface, (255, 255, 255), (i, bottom - 5), (i, bottom), 2)
                 
     def _draw_marchers(self, surface):
-        """Draw animated pixel art marching band."""
-        for marcher in self.pixel_marchers:
-            self._draw_pixel_marcher(surface, marcher['x'], marcher['y'], 
-                                   marcher['color'], marcher['instrument'], marcher['size'])
+        """Draw animated pixel art marching band.
+
+        The static part of each marcher and its animated legs come from
+        cached sprites, and all of them go through one blits() call in
+        marcher order so overlapping marchers layer as before.
+        """
+        sin = math.sin
+        get_sprite = self._get_marcher_sprite
+        get_leg = self._get_leg_sprite
+        blit_buf = self.marcher_blit_buf
+        count = 0
+        phase = self.background_animation * 5
+        right_edge = WINDOW_WIDTH + 50
+        for x, y, color, instrument, size in zip(self.marcher_x, self.marcher_y,
+                                                 self.marcher_color, self.marcher_instrument,
+                                                 self.marcher_size):
+            # Cull off-screen marchers before paying for any drawing
+            if not -50 <= x <= right_edge:
+                continue
+                
+            # Body sprite, then the animated legs below it
+            half = size // 2
+            third = size // 3
+            leg_offset = int(sin(phase + x * 0.1) * size//4)
+            entries = (
+                (get_sprite(color, instrument, size), (x - size, y - size)),
+                (get_leg(third, half + leg_offset), (x - third, y + half)),
+                (get_leg(third, half - leg_offset), (x, y + half)),
+            )
+            for entry in entries:
+                if count < len(blit_buf):
+                    blit_buf[count] = entry
+                else:
+                    blit_buf.append(entry)
+                count += 1
+            
+        del blit_buf[count:]
+        surface.blits(blit_buf, doreturn=False)
                                    
-    def _draw_pixel_marcher(self, surface, x, y, color, instrument, size):
-        """Draw a single pixel art marcher."""
-        if x < -50 or x > WINDOW_WIDTH + 50:
-            return
+    def _get_leg_sprite(self, width, height):
+        """Return the cached solid leg sprite of the given size."""
+        key = (width, height)
+        sprite = self.leg_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(key)
+            sprite.fill((60, 60, 80))
+            self.leg_sprites[key] = sprite
+        return sprite
+        
+    def _get_marcher_sprite(self, color, instrument, size):
+        """Return the cached head/body/instrument sprite for a marcher.
+
+        The sprite's origin is offset by (size, size) from the marcher's
+        anchor point so the instruments on either side fit.
+        """
+        key = (color, instrument, size)
+        sprite = self.marcher_sprites.get(key)
+        if sprite is not None:
+            return sprite
             
+        sprite = pygame.Surface((size * 4, size * 2), pygame.SRCALPHA)
+        x = y = size
+        half = size // 2
+        third = size // 3
+        quarter = size // 4
+        
         # Head
-        pygame.draw.rect(surface, (220, 200, 180), (x - size//2, y - size, size, size//2))
+        pygame.draw.rect(sprite, (220, 200, 180), (x - half, y - size, size, half))
         
         # Body
-        pygame.draw.rect(surface, color, (x - size//2, y - size//2, size, size))
-        
-        # Legs (animated)
-        leg_offset = int(math.sin(self.background_animation * 5 + x * 0.1) * size//4)
-        pygame.draw.rect(surface, (60, 60, 80), (x - size//3, y + size//2, size//3, size//2 + leg_offset))
-        pygame.draw.rect(surface, (60, 60, 80), (x, y + size//2, size//3, size//2 - leg_offset))
+        pygame.draw.rect(sprite, color, (x - half, y - half, size, size))
         
         # Instrument
         if instrument == 'trumpet':
-            pygame.draw.rect(surface, self.colors['brass'], (x + size, y - size//4, size, size//4))
-            pygame.draw.circle(surface, self.colors['brass'], (x + size*2, y - size//8), size//3)
+            brass = self.colors['brass']
+            pygame.draw.rect(sprite, brass, (x + size, y - quarter, size, quarter))
+            pygame.draw.circle(sprite, brass, (x + size*2, y - size//8), third)
         elif instrument == 'drum':
-            pygame.draw.rect(surface, (139, 69, 19), (x - size, y - size//4, size//2, size//2))
-            pygame.draw.rect(surface, (255, 255, 255), (x - size, y - size//4, size//2, size//8))
+            pygame.draw.rect(sprite, (139, 69, 19), (x - size, y - quarter, half, half))
+            pygame.draw.rect(sprite, (255, 255, 255), (x - size, y - quarter, half, size//8))
         elif instrument == 'flag':
-            pygame.draw.rect(surface, (100, 100, 100), (x + size, y - size, size//4, size))
-            pygame.draw.polygon(surface, color, [
+            pygame.draw.rect(sprite, (100, 100, 100), (x + size, y - size, quarter, size))
+            pygame.draw.polygon(sprite, color, [
                 (x + size + size//4, y - size),
                 (x + size + size//4 + size//2, y - size + size//4),
                 (x + size + size//4, y - size + size//2)
             ])
             
+        self.marcher_sprites[key] = sprite
+        return sprite
+            
     def _draw_particles(self, surface):
         """Draw particle effects."""
+        sprites = self.particle_sprites
+        blit_buf = self.particle_blit_buf
+        count = 0
         for particle in self.particles:
             alpha = particle['life'] / 3.0  # Fade out
             size = int(particle['size'] * alpha)
             if size > 0:
-                # Create a surface for the particle with alpha
-                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                color = (*particle['color'], int(255 * alpha))
-                pygame.draw.rect(particle_surf, color, (0, 0, size * 2, size * 2))
-                surface.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
+                # Square particle sprites are cached per (color, size) and
+                # one of 16 fade levels, which keeps the cache small
+                key = (particle['color'], size, min(int(alpha * 15), 15))
+                particle_surf = sprites.get(key)
+                if particle_surf is None:
+                    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    particle_surf.fill((*key[0], key[2] * 17))
+                    sprites[key] = particle_surf
+                    
+                entry = (particle_surf, (particle['x'] - size, particle['y'] - size))
+                if count < len(blit_buf):
+                    blit_buf[count] = entry
+                else:
+                    blit_buf.append(entry)
+                count += 1
+                
+        del blit_buf[count:]
+        surface.blits(blit_buf, doreturn=False)
                 
     def _draw_title(self, surface):
         """Draw animated title with retro styling."""
@@ -503,17 +652,7 @@ class EnhancedMainMenu(State):
         
     def _draw_rainbow_banner(self, surface):
         """Draw rainbow pride banner below title."""
-        banner_y = 200
-        banner_height = 8
-        
-        for i, color in enumerate(self.colors['rainbow']):
-            x = WINDOW_WIDTH // 2 - 200 + i * (400 // len(self.colors['rainbow']))
-            width = 400 // len(self.colors['rainbow']) + 1
-            pygame.draw.rect(surface, color, (x, banner_y, width, banner_height))
-            
-        # Banner border
-        pygame.draw.rect(surface, self.colors['brass'], 
-                        (WINDOW_WIDTH // 2 - 202, banner_y - 2, 404, banner_height + 4), 2)
+        surface.blit(self.banner_surf, self.banner_pos)
                         
     def _draw_buttons(self, surface):
         """Draw all menu buttons."""
@@ -536,15 +675,4 @@ class EnhancedMainMenu(State):
         
     def _draw_pride_flags(self, surface):
         """Draw small pride flag decorations."""
-        flag_positions = [
-            (100, 250), (WINDOW_WIDTH - 100, 250),
-            (100, WINDOW_HEIGHT - 150), (WINDOW_WIDTH - 100, WINDOW_HEIGHT - 150)
-        ]
-        
-        for x, y in flag_positions:
-            # Draw small pride flag
-            for i, color in enumerate(self.colors['rainbow']):
-                flag_y = y + i * 4
-                pygame.draw.rect(surface, color, (x, flag_y, 20, 4))
-            # Flag pole
-            pygame.draw.rect(surface, (100, 100, 100), (x - 2, y - 10, 2, 40))
+        surface.blits(self.flag_blits, doreturn=False)
@@ -6,12 +6,332 @@ keyboard/mouse navigation, skippable dialogue with subtitles, and alternate dial
 
 import pygame
 import math
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 from core.state_manager import State
 from config import (WINDOW_WIDTH, WINDOW_HEIGHT, COLOR_BLUE, COLOR_GOLD, 
                    COLOR_TEXT, COLOR_BG)
 from ui.enhanced_retro_button import EnhancedRetroButton
 
+# Portrait colors used for characters without story data
+DEFAULT_SKIN = (220, 200, 180)
+DEFAULT_HAIR = (100, 100, 100)
+
+# Rendered text surfaces keyed by (font, text, color), least recently used first
+_TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+
+# Typewriter speed of the dialogue box
+TEXT_CHARS_PER_SECOND = 90
+
+
+def _display_format(surf: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display pixel format for fast blitting.
+
+    Surfaces are returned unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+def _freeze_dialogue(entries: List[Dict]) -> Tuple[Mapping, ...]:
+    """Return dialogue entries as a tuple of read-only mappings."""
+    return tuple(MappingProxyType(entry) for entry in entries)
+
+
+# Story data for every named character, keyed by character id; scenes
+# build StoryCharacter objects from these on first use. Dialogue variants
+# are tuples, so every scene shares them read-only
+_CHARACTER_BLUEPRINTS = {
+    'leah': dict(
+        name='Leah',
+        role='Drum Major',
+        skin=(220, 200, 180),
+        hair=(139, 69, 19),
+        uniform=COLOR_BLUE,
+        accent=COLOR_GOLD,
+        personality='disciplined_caring',
+        dialogue_variants={
+            'normal': (
+                "Alright team, let's focus on today's lesson.",
+                "I expect everyone to give their best effort.",
+                "Precision is everything in marching band.",
+                "Let me show you how this is supposed to work."
+            ),
+            'encouraging': (
+                "Great work everyone! You're really improving.",
+                "I knew you could do it! Keep up the excellent work.",
+                "That's exactly what I was looking for. Well done!",
+                "Perfect! You're all becoming true musicians."
+            ),
+            'stressed': (
+                "We need to work harder if we want to win.",
+                "Focus, team! We can't afford mistakes.",
+                "This isn't good enough. Let's run it again.",
+                "I need your full attention on this."
+            )
+        }
+    ),
+    'elijah': dict(
+        name='Elijah',
+        role='Percussionist',
+        skin=(180, 140, 100),
+        hair=(40, 40, 40),
+        uniform=COLOR_BLUE,
+        accent=(220, 20, 60),  # Red for percussion
+        personality='energetic_joking',
+        dialogue_variants={
+            'normal': (
+                "Can we code our way to the trophy? Let's find out!",
+                "Alright team, time to make some noise!",
+                "I've got a rhythm for this... and it's not just in the drums!",
+                "Let's beat this challenge into submission!"
+            ),
+            'joking': (
+                "Next time, more cowbell! That always fixes everything.",
+                "Can we add a drum solo to this code? I think it needs more percussion!",
+                "I call myself 'Chief Dance Officer' now. What do you think, Captain?",
+                "My drumsticks are ready for action! Let's code something epic!"
+            ),
+            'serious': (
+                "Okay, this is serious. We need to nail this formation.",
+                "Sometimes jokes have to wait. This is important.",
+                "Let me handle the rhythm section. I'll make sure we're perfect.",
+                "I'll do whatever it takes to help us win."
+            )
+        }
+    ),
+    'anna': dict(
+        name='Anna',
+        role='Flute Player',
+        skin=(240, 220, 200),
+        hair=(200, 100, 50),
+        uniform=COLOR_BLUE,
+        accent=(144, 238, 144),  # Light green for woodwinds
+        personality='shy_talented',
+        dialogue_variants={
+            'normal': (
+                "Um... I think I understand this part.",
+                "If I may suggest something...",
+                "This reminds me of a flute piece I know.",
+                "I'll try my best to help."
+            ),
+            'confident': (
+                "I know exactly what we need to do here.",
+                "Let me show you how this melody should work.",
+                "I've been practicing this technique. Let me help.",
+                "I have an idea that might improve our performance."
+            ),
+            'supportive': (
+                "We can do this together, everyone.",
+                "Don't worry, I'll help you with that part.",
+                "Your code sounds beautiful. Keep going!",
+                "We make a great team when we work together."
+            )
+        }
+    ),
+    'alex': dict(
+        name='Alex',
+        role='Saxophonist/Tech Expert',
+        skin=(200, 180, 160),
+        hair=(255, 184, 28),  # Golden blonde
+        uniform=COLOR_BLUE,
+        accent=(255, 215, 0),  # Gold for brass
+        personality='tech_savvy_enthusiastic',
+        dialogue_variants={
+            'normal': (
+                "I can code this! Let me show you how.",
+                "The band.api can handle this. Let me write the function.",
+                "I've been working on a solution for exactly this problem.",
+                "Let me sync the music and lights with this code."
+            ),
+            'technical': (
+                "I'll create a class to manage this section efficiently.",
+                "We need to optimize this algorithm for better performance.",
+                "Let me implement a better data structure for this.",
+                "I can write a module that will handle all of this automatically."
+            ),
+            'excited': (
+                "This is amazing! I never thought we could do this with code!",
+                "I have so many ideas for making our show even better!",
+                "Wait until you see what I've programmed for the finale!",
+                "The possibilities are endless when you combine music and code!"
+            )
+        }
+    ),
+    'coach_hodge': dict(
+        name='Coach Hodge',
+        role='Assistant Coach',
+        skin=(180, 160, 140),
+        hair=(100, 100, 100),
+        uniform=(60, 60, 60),
+        accent=COLOR_GOLD,
+        personality='wise_encouraging',
+        dialogue_variants={
+            'normal': (
+                "I'm proud of the progress you're all making.",
+                "Remember the fundamentals, and you'll succeed.",
+                "Great work today, team. Keep it up.",
+                "I have confidence in every one of you."
+            ),
+            'advice': (
+                "In both music and code, attention to detail matters.",
+                "Practice makes perfect, whether you're playing an instrument or debugging code.",
+                "Teamwork is everything. Support each other.",
+                "The best performances come from the heart, and the best code comes from careful thought."
+            ),
+            'proud': (
+                "You've all exceeded my expectations. Bravo!",
+                "This is exactly the kind of performance I knew you were capable of.",
+                "I couldn't be prouder to be your coach.",
+                "You've become not just better musicians, but better problem solvers too."
+            )
+        }
+    )
+}
+
+
+# Story dialogue for each week, as read-only entries shared by every scene
+_WEEK1_DIALOGUE = _freeze_dialogue([
+    {
+        'character': 'coach_hodge',
+        'text': "Welcome to Pride of Code! I'm Coach Hodge, and this is going to be an amazing season.",
+        'emotion': 'normal',
+        'portrait_pose': 'welcoming'
+    },
+    {
+        'character': 'leah',
+        'text': "This is the band room where all the magic happens. It's buzzing with excitement today!",
+        'emotion': 'normal',
+        'portrait_pose': 'proud'
+    },
+    {
+        'character': 'elijah',
+        'text': "Hey Captain! Can we code our way to the trophy? I've got a good feeling about this!",
+        'emotion': 'joking',
+        'portrait_pose': 'excited'
+    },
+    {
+        'character': 'anna',
+        'text': "Um... hi. I'll be helping with the woodwind sections. Your flute playing is beautiful.",
+        'emotion': 'normal',
+        'portrait_pose': 'shy'
+    },
+    {
+        'character': 'alex',
+        'text': "I noticed you have a laptop! I've been working on a band.api interface to sync music and lights!",
+        'emotion': 'excited',
+        'portrait_pose': 'enthusiastic'
+    },
+    {
+        'character': 'leah',
+        'text': "Today, we'll learn about variables - like tempo, uniform colors, and volume settings.",
+        'emotion': 'normal',
+        'portrait_pose': 'teaching'
+    },
+    {
+        'character': 'alex',
+        'text': "Variables are like labeled containers. For example: tempo = 120 sets our marching speed!",
+        'emotion': 'technical',
+        'portrait_pose': 'explaining'
+    },
+    {
+        'character': 'coach_hodge',
+        'text': "We've signed up for a local competition in two weeks. Let's make this count!",
+        'emotion': 'proud',
+        'portrait_pose': 'announcing'
+    }
+])
+
+_WEEK2_DIALOGUE = _freeze_dialogue([
+    {
+        'character': 'leah',
+        'text': "It's competition day! Remember the variable settings we practiced.",
+        'emotion': 'normal',
+        'portrait_pose': 'focused'
+    },
+    {
+        'character': 'elijah',
+        'text': "I've got my drumsticks ready! Let's show them what Pride of Code can do!",
+        'emotion': 'excited',
+        'portrait_pose': 'ready'
+    },
+    {
+        'character': 'alex',
+        'text': "I've set up conditional code: if weather == 'rain', we'll use indoor formation!",
+        'emotion': 'technical',
+        'portrait_pose': 'prepared'
+    }
+])
+
+# Week 2 closing lines depending on the competition outcome
+_WEEK2_WIN_DIALOGUE = _freeze_dialogue([
+    {
+        'character': 'leah',
+        'text': "We won! Thank you for helping us create such a perfect routine!",
+        'emotion': 'encouraging',
+        'portrait_pose': 'celebrating'
+    },
+    {
+        'character': 'elijah',
+        'text': "Victory march time! I call myself 'Chief Dance Officer' now!",
+        'emotion': 'joking',
+        'portrait_pose': 'victory'
+    }
+])
+
+_WEEK2_LOSS_DIALOGUE = _freeze_dialogue([
+    {
+        'character': 'leah',
+        'text': "We didn't win, but we gave it our all. Next time, we'll be even better.",
+        'emotion': 'stressed',
+        'portrait_pose': 'determined'
+    },
+    {
+        'character': 'elijah',
+        'text': "Next time, more cowbell! And maybe fewer rainy day performances!",
+        'emotion': 'joking',
+        'portrait_pose': 'optimistic'
+    }
+])
+
+# Dialogue for weeks without their own script
+_DEFAULT_DIALOGUE = _freeze_dialogue([
+    {
+        'character': 'coach_hodge',
+        'text': "Let's continue working on our Python skills and marching routines!",
+        'emotion': 'normal',
+        'portrait_pose': 'encouraging'
+    }
+])
+
+
+class StoryCharacter:
+    """Portrait colors, dialogue and pre-rendered captions for one character."""
+    
+    __slots__ = ('name', 'role', 'skin', 'hair', 'uniform', 'accent', 'palette',
+                 'personality', 'dialogue_variants', 'name_surf', 'role_surf')
+    
+    def __init__(self, name: str, role: str = '', skin=DEFAULT_SKIN, hair=DEFAULT_HAIR,
+                 uniform=COLOR_BLUE, accent=COLOR_GOLD, personality: str = '',
+                 dialogue_variants: Optional[Dict[str, Tuple[str, ...]]] = None):
+        self.name = name
+        self.role = role
+        self.skin = skin
+        self.hair = hair
+        self.uniform = uniform
+        self.accent = accent
+        # Portrait colors in drawing order, unpacked in one step by the sprite
+        self.palette = (skin, hair, uniform, accent)
+        self.personality = personality
+        self.dialogue_variants = dialogue_variants or {}
+        
+        # Caption surfaces, rendered by the scene once fonts exist
+        self.name_surf: Optional[pygame.Surface] = None
+        self.role_surf: Optional[pygame.Surface] = None
+
 
 class EnhancedStoryScene(State):
     """Enhanced story scene with comprehensive dialogue system and character portraits."""
@@ -32,30 +352,42 @@ class EnhancedStoryScene(State):
             'progress': (150, 150, 150)               # Progress indicator
         }
         
-        # Fonts - ensure ≥18px for readability
+        # Colors used every frame, looked up once
+        self.box_color = self.colors['dialogue_box']
+        self.border_color = self.colors['border']
+        self.prompt_color = self.colors['subtitle']
+        self.choice_color = self.colors['choices']
+        self.progress_color = self.colors['progress']
+        
+        # Fonts - ensure ≥18px for readability. Font() has no bold argument,
+        # so the name font is emboldened with set_bold()
         try:
             self.font_dialogue = pygame.font.Font(None, 24)      # 24px for main dialogue
-            self.font_name = pygame.font.Font(None, 28, bold=True)  # 28px for character names
+            self.font_name = pygame.font.Font(None, 28)         # 28px for character names
+            self.font_name.set_bold(True)
             self.font_subtitle = pygame.font.Font(None, 18)     # 18px for subtitles
             self.font_choice = pygame.font.Font(None, 20)       # 20px for choices
             self.font_small = pygame.font.Font(None, 16)        # 16px for UI elements
-        except:
+        except (OSError, pygame.error):
+            # Default font unavailable (e.g. stripped install)
             self.font_dialogue = pygame.font.SysFont('arial', 24)
             self.font_name = pygame.font.SysFont('arial', 28, bold=True)
             self.font_subtitle = pygame.font.SysFont('arial', 18)
             self.font_choice = pygame.font.SysFont('arial', 20)
             self.font_small = pygame.font.SysFont('arial', 16)
         
-        # Character portraits and data
-        self.characters = self._create_character_data()
+        # Character portraits and data, built on first use by _get_character()
+        self.characters: Dict[str, StoryCharacter] = {}
         
         # Dialogue system
         self.current_dialogue = None
-        self.dialogue_sequence = []
+        self.dialogue_sequence = ()
         self.dialogue_index = 0
         self.dialogue_complete = False
-        self.text_animation_progress = 0.0
-        self.text_speed = 0.02  # Characters per frame
+        self.chars_shown = 0.0
+        self.chars_target = 0
+        self.text_speed = TEXT_CHARS_PER_SECOND  # Characters per second
+        self._prepare_dialogue_sequence()
         self.auto_advance = False
         self.auto_advance_timer = 0.0
         
@@ -68,186 +400,128 @@ class EnhancedStoryScene(State):
         self.show_subtitles = True
         self.skippable = True
         self.choices_available = []
+        self.choice_buttons = []
         self.selected_choice = 0
         
+        # Keydown handlers, with the choice menu overriding navigation keys
+        self.key_handlers = {
+            pygame.K_SPACE: self._advance_dialogue,
+            pygame.K_RETURN: self._advance_dialogue,
+            pygame.K_ESCAPE: self._skip_if_allowed,
+            pygame.K_s: self._toggle_subtitles,
+        }
+        self.choice_key_handlers = dict(self.key_handlers)
+        self.choice_key_handlers.update({
+            pygame.K_UP: self._select_previous_choice,
+            pygame.K_DOWN: self._select_next_choice,
+            pygame.K_RETURN: self._make_choice,
+        })
+        
         # Animation
         self.portrait_animation = 0.0
         self.fade_alpha = 0.0
         self.scene_transition = False
         
-        # Background
-        self.background_surface = None
+        # Static layout of the portrait and dialogue box
+        self.portrait_rect = pygame.Rect(100, WINDOW_HEIGHT // 2 - 100, 150, 150)
+        self.name_pos = (self.portrait_rect.x - 20, self.portrait_rect.bottom + 20)
+        self.role_pos = (self.portrait_rect.x - 20, self.portrait_rect.bottom + 50)
+        self.dialogue_box_rect = pygame.Rect(300, WINDOW_HEIGHT // 2 - 80, WINDOW_WIDTH - 350, 200)
+        self.dialogue_line_positions = [
+            (self.dialogue_box_rect.x + 20, self.dialogue_box_rect.y + 20 + i * 30)
+            for i in range(6)
+        ]
+        self.prompt_pos = (self.dialogue_box_rect.x + 20, self.dialogue_box_rect.bottom - 30)
+        
+        # Portrait frame and sprite cache keyed by (character, emotion, bounce)
+        self.portrait_frame = self._create_portrait_frame(self.portrait_rect.width)
+        self.portrait_frame_pos = self.portrait_frame.get_rect(center=self.portrait_rect.center)
+        self.portrait_sprites = {}
+        
+        # Dialogue box background and border, drawn once, and the blit list
+        # of the last drawn box keyed by (dialogue index, characters shown)
+        self.dialogue_box_surf = self._create_dialogue_box()
+        self.dialogue_box_blits = []
+        self.dialogue_box_key = None
+        
+        # Subtitle block backgrounds keyed by height; blocks only differ in
+        # their number of lines, so entries share them
+        self.subtitle_backgrounds = {}
         
-    def _create_character_data(self) -> Dict:
-        """Create character data with portraits and dialogue variants."""
-        return {
-            'leah': {
-                'name': 'Leah',
-                'role': 'Drum Major',
-                'portrait_colors': {
-                    'skin': (220, 200, 180),
-                    'hair': (139, 69, 19),
-                    'uniform': COLOR_BLUE,
-                    'accent': COLOR_GOLD
-                },
-                'personality': 'disciplined_caring',
-                'dialogue_variants': {
-                    'normal': [
-                        "Alright team, let's focus on today's lesson.",
-                        "I expect everyone to give their best effort.",
-                        "Precision is everything in marching band.",
-                        "Let me show you how this is supposed to work."
-                    ],
-                    'encouraging': [
-                        "Great work everyone! You're really improving.",
-                        "I knew you could do it! Keep up the excellent work.",
-                        "That's exactly what I was looking for. Well done!",
-                        "Perfect! You're all becoming true musicians."
-                    ],
-                    'stressed': [
-                        "We need to work harder if we want to win.",
-                        "Focus, team! We can't afford mistakes.",
-                        "This isn't good enough. Let's run it again.",
-                        "I need your full attention on this."
-                    ]
-                }
-            },
-            'elijah': {
-                'name': 'Elijah',
-                'role': 'Percussionist',
-                'portrait_colors': {
-                    'skin': (180, 140, 100),
-                    'hair': (40, 40, 40),
-                    'uniform': COLOR_BLUE,
-                    'accent': (220, 20, 60)  # Red for percussion
-                },
-                'personality': 'energetic_joking',
-                'dialogue_variants': {
-                    'normal': [
-                        "Can we code our way to the trophy? Let's find out!",
-                        "Alright team, time to make some noise!",
-                        "I've got a rhythm for this... and it's not just in the drums!",
-                        "Let's beat this challenge into submission!"
-                    ],
-                    'joking': [
-                        "Next time, more cowbell! That always fixes everything.",
-                        "Can we add a drum solo to this code? I think it needs more percussion!",
-                        "I call myself 'Chief Dance Officer' now. What do you think, Captain?",
-                        "My drumsticks are ready for action! Let's code something epic!"
-                    ],
-                    'serious': [
-                        "Okay, this is serious. We need to nail this formation.",
-                        "Sometimes jokes have to wait. This is important.",
-                        "Let me handle the rhythm section. I'll make sure we're perfect.",
-                        "I'll do whatever it takes to help us win."
-                    ]
-                }
-            },
-            'anna': {
-                'name': 'Anna',
-                'role': 'Flute Player',
-                'portrait_colors': {
-                    'skin': (240, 220, 200),
-                    'hair': (200, 100, 50),
-                    'uniform': COLOR_BLUE,
-                    'accent': (144, 238, 144)  # Light green for woodwinds
-                },
-                'personality': 'shy_talented',
-                'dialogue_variants': {
-                    'normal': [
-                        "Um... I think I understand this part.",
-                        "If I may suggest something...",
-                        "This reminds me of a flute piece I know.",
-                        "I'll try my best to help."
-                    ],
-                    'confident': [
-                        "I know exactly what we need to do here.",
-                        "Let me show you how this melody should work.",
-                        "I've been practicing this technique. Let me help.",
-                        "I have an idea that might improve our performance."
-                    ],
-                    'supportive': [
-                        "We can do this together, everyone.",
-                        "Don't worry, I'll help you with that part.",
-                        "Your code sounds beautiful. Keep going!",
-                        "We make a great team when we work together."
-                    ]
-                }
-            },
-            'alex': {
-                'name': 'Alex',
-                'role': 'Saxophonist/Tech Expert',
-                'portrait_colors': {
-                    'skin': (200, 180, 160),
-                    'hair': (255, 184, 28),  # Golden blonde
-                    'uniform': COLOR_BLUE,
-                    'accent': (255, 215, 0)  # Gold for brass
-                },
-                'personality': 'tech_savvy_enthusiastic',
-                'dialogue_variants': {
-                    'normal': [
-                        "I can code this! Let me show you how.",
-                        "The band.api can handle this. Let me write the function.",
-                        "I've been working on a solution for exactly this problem.",
-                        "Let me sync the music and lights with this code."
-                    ],
-                    'technical': [
-                        "I'll create a class to manage this section efficiently.",
-                        "We need to optimize this algorithm for better performance.",
-                        "Let me implement a better data structure for this.",
-                        "I can write a module that will handle all of this automatically."
-                    ],
-                    'excited': [
-                        "This is amazing! I never thought we could do this with code!",
-                        "I have so many ideas for making our show even better!",
-                        "Wait until you see what I've programmed for the finale!",
-                        "The possibilities are endless when you combine music and code!"
-                    ]
-                }
-            },
-            'coach_hodge': {
-                'name': 'Coach Hodge',
-                'role': 'Assistant Coach',
-                'portrait_colors': {
-                    'skin': (180, 160, 140),
-                    'hair': (100, 100, 100),
-                    'uniform': (60, 60, 60),
-                    'accent': COLOR_GOLD
-                },
-                'personality': 'wise_encouraging',
-                'dialogue_variants': {
-                    'normal': [
-                        "I'm proud of the progress you're all making.",
-                        "Remember the fundamentals, and you'll succeed.",
-                        "Great work today, team. Keep it up.",
-                        "I have confidence in every one of you."
-                    ],
-                    'advice': [
-                        "In both music and code, attention to detail matters.",
-                        "Practice makes perfect, whether you're playing an instrument or debugging code.",
-                        "Teamwork is everything. Support each other.",
-                        "The best performances come from the heart, and the best code comes from careful thought."
-                    ],
-                    'proud': [
-                        "You've all exceeded my expectations. Bravo!",
-                        "This is exactly the kind of performance I knew you were capable of.",
-                        "I couldn't be prouder to be your coach.",
-                        "You've become not just better musicians, but better problem solvers too."
-                    ]
-                }
-            }
+        # Reusable full-screen fade overlay, modulated with set_alpha()
+        self.fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.fade_surface.fill((0, 0, 0))
+        self.fade_surface_alpha = None
+        
+        # What the last drawn and last presented frames showed, used to
+        # report dirty rects: everything but the typewriter text lives in
+        # frame_state, the revealed character count in text_state
+        self.portrait_bounce = 0
+        self.frame_state = None
+        self.text_state = None
+        self.presented_frame_state = None
+        self.presented_text_state = None
+        
+        # Background (all locations are pre-rendered once, and converted to
+        # the display format as soon as a display mode exists)
+        self.background_surface = None
+        self.backgrounds_converted = False
+        self.background_cache = {
+            'band_room': self._create_band_room_background(),
+            'stadium': self._create_stadium_background(),
+            'practice_field': self._create_practice_field_background()
         }
         
+    def _render_captions(self, character_data: StoryCharacter):
+        """Render a character's name and role captions."""
+        character_data.name_surf = _display_format(self.font_name.render(
+            character_data.name, True, self.colors['name_text']))
+        character_data.role_surf = _display_format(self.font_small.render(
+            character_data.role, True, self.colors['subtitle']))
+        
+    def _get_character(self, character: str) -> StoryCharacter:
+        """Return story data for a character id, building it (and rendering
+        its captions) on first use. Unknown ids get a placeholder named after
+        the id with default colors."""
+        character_data = self.characters.get(character)
+        if character_data is None:
+            blueprint = _CHARACTER_BLUEPRINTS.get(character)
+            if blueprint is None:
+                character_data = StoryCharacter(character)
+            else:
+                character_data = StoryCharacter(**blueprint)
+            self._render_captions(character_data)
+            self.characters[character] = character_data
+        return character_data
+        
+    def _render_cached(self, font, text: str, color) -> pygame.Surface:
+        """Render text through the shared LRU surface cache."""
+        key = (font, text, color)
+        text_surf = _text_cache.get(key)
+        if text_surf is None:
+            text_surf = font.render(text, True, color)
+            _text_cache[key] = text_surf
+            if len(_text_cache) > _TEXT_CACHE_SIZE:
+                _text_cache.popitem(last=False)
+        else:
+            _text_cache.move_to_end(key)
+        return text_surf
+        
     def start_story_sequence(self, week: int, context: Dict = None):
         """Start a story sequence for a specific week."""
         self.current_week = week
         self.story_context = context or {}
         self.dialogue_complete = False
-        self.text_animation_progress = 0.0
         
         # Get dialogue sequence for this week
         self.dialogue_sequence = self._get_week_dialogue(week)
         self.dialogue_index = 0
+        self._prepare_dialogue_sequence()
+        self._start_text_animation()
+        
+        # Build the week's cast and their portrait poses up front rather
+        # than mid-dialogue
+        self._warm_portrait_cache()
         
         # Load appropriate background
         self._load_background(week)
@@ -256,137 +530,141 @@ class EnhancedStoryScene(State):
         self.fade_alpha = 255
         self.scene_transition = True
         
-    def _get_week_dialogue(self, week: int) -> List[Dict]:
+    def _start_text_animation(self):
+        """Restart the typewriter for the current dialogue entry."""
+        self.chars_shown = 0.0
+        if self.dialogue_index < len(self.dialogue_texts):
+            self.chars_target = len(self.dialogue_texts[self.dialogue_index])
+        else:
+            self.chars_target = 0
+            
+    def _prepare_dialogue_sequence(self):
+        """Flatten the dialogue sequence into parallel per-line lists.
+
+        The wrapped dialogue box lines and the subtitle block are rendered
+        here once, so drawing a line never rasterizes text.
+        """
+        text_color = self.colors['text']
+        self.dialogue_characters = []
+        self.dialogue_emotions = []
+        self.dialogue_texts = []
+        self.dialogue_lines = []
+        self.dialogue_line_starts = []
+        self.dialogue_line_surfs = []
+        self.dialogue_line_offsets = []
+        self.subtitle_blits = []
+        self.dialogue_box_key = None
+        
+        for entry in self.dialogue_sequence:
+            text = entry['text']
+            self.dialogue_characters.append(entry['character'])
+            self.dialogue_emotions.append(entry.get('emotion', 'normal'))
+            self.dialogue_texts.append(text)
+            
+            # Dialogue box lines (maximum 6) and the text index each starts at;
+            # every wrap consumes one separating space
+            lines = self._wrap_text(text, self.font_dialogue, WINDOW_WIDTH - 350 - 40)[:6]
+            starts = []
+            start = 0
+            for line in lines:
+                starts.append(start)
+                start += len(line) + 1
+            self.dialogue_lines.append(lines)
+            self.dialogue_line_starts.append(starts)
+            self.dialogue_line_surfs.append(
+                [_display_format(self.font_dialogue.render(line, True, text_color))
+                 for line in lines])
+            
+            # Pixel width of every prefix of each line, for the typewriter clip
+            size = self.font_dialogue.size
+            self.dialogue_line_offsets.append(
+                [[size(line[:k])[0] for k in range(len(line) + 1)] for line in lines])
+            
+            # Subtitle background and centered lines as one blit list
+            subtitle_lines = self._wrap_text(text, self.font_subtitle, WINDOW_WIDTH - 100)
+            subtitle_height = len(subtitle_lines) * 20 + 20
+            subtitle_y = WINDOW_HEIGHT - subtitle_height - 20
+            blits = [(self._get_subtitle_background(subtitle_height), (20, subtitle_y))]
+            for i, line in enumerate(subtitle_lines):
+                text_surf = _display_format(self.font_subtitle.render(line, True, text_color))
+                text_rect = text_surf.get_rect(center=(WINDOW_WIDTH // 2, subtitle_y + 15 + i * 20))
+                blits.append((text_surf, text_rect))
+            self.subtitle_blits.append(blits)
+            
+    def _get_subtitle_background(self, height: int) -> pygame.Surface:
+        """Return the translucent subtitle background of a given height."""
+        bg_surf = self.subtitle_backgrounds.get(height)
+        if bg_surf is None:
+            bg_surf = pygame.Surface((WINDOW_WIDTH - 40, height), pygame.SRCALPHA)
+            bg_surf.fill((0, 0, 0, 180))
+            bg_surf = _display_format(bg_surf)
+            self.subtitle_backgrounds[height] = bg_surf
+        return bg_surf
+        
+    def _wrap_text(self, text: str, font, max_width: int) -> List[str]:
+        """Greedily word wrap text into lines no wider than max_width.
+
+        Each word is measured once and line widths are estimated by summing
+        word and space widths. Kerning makes the sum drift by about a pixel per
+        word, so only candidates within that margin of max_width are measured
+        as a whole line.
+        """
+        lines = []
+        current_line = []
+        line_width = 0
+        space_width = font.size(' ')[0]
+        
+        for word in text.split(' '):
+            word_width = font.size(word)[0]
+            test_width = line_width + space_width + word_width if current_line else word_width
+            margin = len(current_line) + 2
+            if abs(test_width - max_width) <= margin:
+                test_width = font.size(' '.join(current_line + [word]))[0]
+            if test_width > max_width:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    line_width = word_width
+                else:
+                    lines.append(word)
+            else:
+                current_line.append(word)
+                line_width = test_width
+                
+        if current_line:
+            lines.append(' '.join(current_line))
+        return lines
+        
+    def _get_week_dialogue(self, week: int) -> Tuple[Mapping, ...]:
         """Get dialogue sequence for a specific week."""
         if week == 1:
-            return [
-                {
-                    'character': 'coach_hodge',
-                    'text': "Welcome to Pride of Code! I'm Coach Hodge, and this is going to be an amazing season.",
-                    'emotion': 'normal',
-                    'portrait_pose': 'welcoming'
-                },
-                {
-                    'character': 'leah',
-                    'text': "This is the band room where all the magic happens. It's buzzing with excitement today!",
-                    'emotion': 'normal',
-                    'portrait_pose': 'proud'
-                },
-                {
-                    'character': 'elijah',
-                    'text': "Hey Captain! Can we code our way to the trophy? I've got a good feeling about this!",
-                    'emotion': 'joking',
-                    'portrait_pose': 'excited'
-                },
-                {
-                    'character': 'anna',
-                    'text': "Um... hi. I'll be helping with the woodwind sections. Your flute playing is beautiful.",
-                    'emotion': 'normal',
-                    'portrait_pose': 'shy'
-                },
-                {
-                    'character': 'alex',
-                    'text': "I noticed you have a laptop! I've been working on a band.api interface to sync music and lights!",
-                    'emotion': 'excited',
-                    'portrait_pose': 'enthusiastic'
-                },
-                {
-                    'character': 'leah',
-                    'text': "Today, we'll learn about variables - like tempo, uniform colors, and volume settings.",
-                    'emotion': 'normal',
-                    'portrait_pose': 'teaching'
-                },
-                {
-                    'character': 'alex',
-                    'text': "Variables are like labeled containers. For example: tempo = 120 sets our marching speed!",
-                    'emotion': 'technical',
-                    'portrait_pose': 'explaining'
-                },
-                {
-                    'character': 'coach_hodge',
-                    'text': "We've signed up for a local competition in two weeks. Let's make this count!",
-                    'emotion': 'proud',
-                    'portrait_pose': 'announcing'
-                }
-            ]
+            return _WEEK1_DIALOGUE
         elif week == 2:
-            base_dialogue = [
-                {
-                    'character': 'leah',
-                    'text': "It's competition day! Remember the variable settings we practiced.",
-                    'emotion': 'normal',
-                    'portrait_pose': 'focused'
-                },
-                {
-                    'character': 'elijah',
-                    'text': "I've got my drumsticks ready! Let's show them what Pride of Code can do!",
-                    'emotion': 'excited',
-                    'portrait_pose': 'ready'
-                },
-                {
-                    'character': 'alex',
-                    'text': "I've set up conditional code: if weather == 'rain', we'll use indoor formation!",
-                    'emotion': 'technical',
-                    'portrait_pose': 'prepared'
-                }
-            ]
-            
             # Different dialogue based on competition outcome
             if self.competition_outcome == 'win':
-                base_dialogue.extend([
-                    {
-                        'character': 'leah',
-                        'text': "We won! Thank you for helping us create such a perfect routine!",
-                        'emotion': 'encouraging',
-                        'portrait_pose': 'celebrating'
-                    },
-                    {
-                        'character': 'elijah',
-                        'text': "Victory march time! I call myself 'Chief Dance Officer' now!",
-                        'emotion': 'joking',
-                        'portrait_pose': 'victory'
-                    }
-                ])
-            else:
-                base_dialogue.extend([
-                    {
-                        'character': 'leah',
-                        'text': "We didn't win, but we gave it our all. Next time, we'll be even better.",
-                        'emotion': 'stressed',
-                        'portrait_pose': 'determined'
-                    },
-                    {
-                        'character': 'elijah',
-                        'text': "Next time, more cowbell! And maybe fewer rainy day performances!",
-                        'emotion': 'joking',
-                        'portrait_pose': 'optimistic'
-                    }
-                ])
-                
-            return base_dialogue
+                return _WEEK2_DIALOGUE + _WEEK2_WIN_DIALOGUE
+            return _WEEK2_DIALOGUE + _WEEK2_LOSS_DIALOGUE
             
         # Default dialogue for other weeks
-        return [
-            {
-                'character': 'coach_hodge',
-                'text': "Let's continue working on our Python skills and marching routines!",
-                'emotion': 'normal',
-                'portrait_pose': 'encouraging'
-            }
-        ]
+        return _DEFAULT_DIALOGUE
         
     def _load_background(self, week: int):
         """Load appropriate background for the story scene."""
-        # Create different backgrounds based on location
+        if not self.backgrounds_converted and pygame.display.get_surface() is not None:
+            for location, background in self.background_cache.items():
+                self.background_cache[location] = _display_format(background, alpha=False)
+            self.backgrounds_converted = True
+            
+        # Pick the pre-rendered background for the location
         if week == 1:
             # Band room background
-            self.background_surface = self._create_band_room_background()
+            self.background_surface = self.background_cache['band_room']
         elif week % 2 == 0:
             # Competition stadium background
-            self.background_surface = self._create_stadium_background()
+            self.background_surface = self.background_cache['stadium']
         else:
             # Practice field background
-            self.background_surface = self._create_practice_field_background()
+            self.background_surface = self.background_cache['practice_field']
             
     def _create_band_room_background(self) -> pygame.Surface:
         """Create band room background."""
@@ -403,13 +681,15 @@ class EnhancedStoryScene(State):
         for y in range(WINDOW_HEIGHT // 2, WINDOW_HEIGHT, 20):
             pygame.draw.line(surface, floor_color, (0, y), (WINDOW_WIDTH, y), 3)
             
-        # Draw music stands
+        # Draw music stands (one pre-rendered stand, placed in a single batch)
         stand_color = (60, 60, 60)
-        for x in range(100, WINDOW_WIDTH - 100, 200):
-            # Stand pole
-            pygame.draw.rect(surface, stand_color, (x, WINDOW_HEIGHT - 200, 4, 120))
-            # Stand top
-            pygame.draw.rect(surface, stand_color, (x - 30, WINDOW_HEIGHT - 210, 60, 15))
+        stand_surf = pygame.Surface((60, 130), pygame.SRCALPHA)
+        # Stand pole
+        stand_surf.fill(stand_color, (30, 10, 4, 120))
+        # Stand top
+        stand_surf.fill(stand_color, (0, 0, 60, 15))
+        surface.blits([(stand_surf, (x - 30, WINDOW_HEIGHT - 210))
+                       for x in range(100, WINDOW_WIDTH - 100, 200)], doreturn=False)
             
         # Draw instruments on walls
         self._draw_wall_instruments(surface)
@@ -421,13 +701,11 @@ class EnhancedStoryScene(State):
         surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         
         # Sky gradient
-        for y in range(WINDOW_HEIGHT // 2):
-            color = (135 - y // 4, 206 - y // 4, 235 - y // 4)
-            pygame.draw.line(surface, color, (0, y), (WINDOW_WIDTH, y))
+        self._draw_sky_gradient(surface, (135, 206, 235), 4)
             
         # Field
         field_color = (34, 139, 34)
-        pygame.draw.rect(surface, field_color, (0, WINDOW_HEIGHT // 2, WINDOW_WIDTH, WINDOW_HEIGHT // 2))
+        surface.fill(field_color, (0, WINDOW_HEIGHT // 2, WINDOW_WIDTH, WINDOW_HEIGHT // 2))
         
         # Field lines
         for x in range(0, WINDOW_WIDTH, 100):
@@ -435,8 +713,8 @@ class EnhancedStoryScene(State):
             
         # Stadium stands
         stand_color = (80, 80, 80)
-        pygame.draw.rect(surface, stand_color, (0, 0, WINDOW_WIDTH, 50))
-        pygame.draw.rect(surface, stand_color, (0, WINDOW_HEIGHT - 50, WINDOW_WIDTH, 50))
+        surface.fill(stand_color, (0, 0, WINDOW_WIDTH, 50))
+        surface.fill(stand_color, (0, WINDOW_HEIGHT - 50, WINDOW_WIDTH, 50))
         
         return surface
         
@@ -445,9 +723,7 @@ class EnhancedStoryScene(State):
         surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         
         # Sky
-        for y in range(WINDOW_HEIGHT // 2):
-            color = (135 - y // 6, 206 - y // 6, 250 - y // 6)
-            pygame.draw.line(surface, color, (0, y), (WINDOW_WIDTH, y))
+        self._draw_sky_gradient(surface, (135, 206, 250), 6)
             
         # Practice field
         field_color = (40, 120, 40)
@@ -463,52 +739,70 @@ class EnhancedStoryScene(State):
                 
         return surface
         
+    def _draw_sky_gradient(self, surface: pygame.Surface, top_color: Tuple[int, int, int],
+                           rows_per_shade: int):
+        """Fill the top half of the screen with a sky that darkens one shade
+        every ``rows_per_shade`` rows, using one fill per band of rows."""
+        r, g, b = top_color
+        sky_height = WINDOW_HEIGHT // 2
+        for shade, y in enumerate(range(0, sky_height, rows_per_shade)):
+            surface.fill((r - shade, g - shade, b - shade),
+                         (0, y, WINDOW_WIDTH, min(rows_per_shade, sky_height - y)))
+            
     def _draw_wall_instruments(self, surface: pygame.Surface):
         """Draw instrument silhouettes on walls."""
         instrument_color = (60, 40, 20)
         
-        # Trumpets
-        for x in range(200, WINDOW_WIDTH - 200, 300):
-            pygame.draw.rect(surface, instrument_color, (x, 100, 8, 40))
-            pygame.draw.rect(surface, instrument_color, (x + 8, 90, 20, 4))
-            pygame.draw.circle(surface, instrument_color, (x + 32, 92), 8)
-            
-        # Drum sets
-        for x in range(350, WINDOW_WIDTH - 350, 400):
-            pygame.draw.rect(surface, instrument_color, (x, 120, 6, 30))
-            pygame.draw.circle(surface, instrument_color, (x + 3, 140), 10)
-            pygame.draw.circle(surface, instrument_color, (x + 3, 155), 8)
+        # Trumpets (sprite origin is the top-left of the bell at (x, 84))
+        trumpet_surf = pygame.Surface((48, 60), pygame.SRCALPHA)
+        trumpet_surf.fill(instrument_color, (0, 16, 8, 40))
+        trumpet_surf.fill(instrument_color, (8, 6, 20, 4))
+        pygame.draw.circle(trumpet_surf, instrument_color, (32, 8), 8)
+        
+        # Drum sets (sprite origin at (x - 10, 120))
+        drum_surf = pygame.Surface((24, 48), pygame.SRCALPHA)
+        drum_surf.fill(instrument_color, (10, 0, 6, 30))
+        pygame.draw.circle(drum_surf, instrument_color, (13, 20), 10)
+        pygame.draw.circle(drum_surf, instrument_color, (13, 35), 8)
+        
+        blits = [(trumpet_surf, (x, 84)) for x in range(200, WINDOW_WIDTH - 200, 300)]
+        blits += [(drum_surf, (x - 10, 120)) for x in range(350, WINDOW_WIDTH - 350, 400)]
+        surface.blits(blits, doreturn=False)
             
     def handle_event(self, ev):
         """Handle input events for dialogue system."""
         if ev.type == pygame.KEYDOWN:
-            if ev.key == pygame.K_SPACE or ev.key == pygame.K_RETURN:
-                self._advance_dialogue()
-            elif ev.key == pygame.K_ESCAPE:
-                if self.skippable:
-                    self._skip_dialogue()
-            elif ev.key == pygame.K_s:
-                self.show_subtitles = not self.show_subtitles
+            handlers = self.choice_key_handlers if self.choices_available else self.key_handlers
+            handler = handlers.get(ev.key)
+            if handler:
+                handler()
                 
         elif ev.type == pygame.MOUSEBUTTONDOWN:
             if ev.button == 1:  # Left click
                 self._advance_dialogue()
                 
-        # Handle choice selection
-        if self.choices_available:
-            if ev.type == pygame.KEYDOWN:
-                if ev.key == pygame.K_UP:
-                    self.selected_choice = (self.selected_choice - 1) % len(self.choices_available)
-                elif ev.key == pygame.K_DOWN:
-                    self.selected_choice = (self.selected_choice + 1) % len(self.choices_available)
-                elif ev.key == pygame.K_RETURN:
-                    self._make_choice()
-                    
+    def _skip_if_allowed(self):
+        """Skip the dialogue sequence when the scene is skippable."""
+        if self.skippable:
+            self._skip_dialogue()
+            
+    def _toggle_subtitles(self):
+        """Show or hide the subtitle block."""
+        self.show_subtitles = not self.show_subtitles
+        
+    def _select_previous_choice(self):
+        """Move the choice highlight up, wrapping around."""
+        self.selected_choice = (self.selected_choice - 1) % len(self.choices_available)
+        
+    def _select_next_choice(self):
+        """Move the choice highlight down, wrapping around."""
+        self.selected_choice = (self.selected_choice + 1) % len(self.choices_available)
+        
     def _advance_dialogue(self):
         """Advance to the next dialogue or choice."""
-        if self.text_animation_progress < 1.0:
+        if self.chars_shown < self.chars_target:
             # Skip text animation
-            self.text_animation_progress = 1.0
+            self.chars_shown = self.chars_target
         else:
             # Move to next dialogue
             self.dialogue_index += 1
@@ -517,7 +811,7 @@ class EnhancedStoryScene(State):
                 self.dialogue_complete = True
                 self._end_story_sequence()
             else:
-                self.text_animation_progress = 0.0
+                self._start_text_animation()
                 
     def _skip_dialogue(self):
         """Skip the entire dialogue sequence."""
@@ -529,9 +823,19 @@ class EnhancedStoryScene(State):
         if self.choices_available and self.selected_choice < len(self.choices_available):
             choice = self.choices_available[self.selected_choice]
             # Process choice outcome
-            self.choices_available = []
+            self.set_choices([])
             self._advance_dialogue()
             
+    def set_choices(self, choices: List[str]):
+        """Offer a set of dialogue choices, building their buttons once."""
+        self.choices_available = list(choices)
+        self.selected_choice = 0
+        choice_y = WINDOW_HEIGHT - 200
+        self.choice_buttons = [
+            EnhancedRetroButton(WINDOW_WIDTH // 2 - 150, choice_y + i * 40, 300, 35, choice)
+            for i, choice in enumerate(self.choices_available)
+        ]
+            
     def _end_story_sequence(self):
         """End the story sequence and return to appropriate scene."""
         # Fade out
@@ -550,8 +854,8 @@ class EnhancedStoryScene(State):
         self.portrait_animation += dt * 2
         
         # Update text animation
-        if self.text_animation_progress < 1.0:
-            self.text_animation_progress = min(1.0, self.text_animation_progress + self.text_speed)
+        if self.chars_shown < self.chars_target:
+            self.chars_shown = min(self.chars_target, self.chars_shown + self.text_speed * dt)
             
         # Update auto-advance timer
         if self.auto_advance:
@@ -567,39 +871,65 @@ class EnhancedStoryScene(State):
                 
     def draw(self, surface):
         """Render the enhanced story scene."""
-        # Draw background
-        if self.background_surface:
+        # Draw background; a fully opaque fade hides it completely, so
+        # just clear to black instead of blitting and blending over it
+        if self.fade_alpha >= 255:
+            surface.fill((0, 0, 0))
+        elif self.background_surface:
             surface.blit(self.background_surface, (0, 0))
         else:
             surface.fill(COLOR_BG)
             
         # Apply fade overlay
-        if self.fade_alpha > 0:
-            fade_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            fade_surf.fill((0, 0, 0, self.fade_alpha))
-            surface.blit(fade_surf, (0, 0))
+        if 0 < self.fade_alpha < 255:
+            alpha = int(self.fade_alpha)
+            if alpha != self.fade_surface_alpha:
+                self.fade_surface.set_alpha(alpha)
+                self.fade_surface_alpha = alpha
+            surface.blit(self.fade_surface, (0, 0))
             
         # Draw dialogue system
         if not self.dialogue_complete and self.dialogue_sequence:
             self._draw_dialogue_system(surface)
             
+        self.frame_state = (self.dialogue_index, self.dialogue_complete, self.show_subtitles,
+                            self.portrait_bounce, int(self.fade_alpha), self.selected_choice,
+                            len(self.choices_available), id(self.background_surface))
+        self.text_state = int(self.chars_shown)
+        
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Report what changed since the last presented frame.
+
+        While text is typing only the dialogue box changes, and once it is
+        fully shown (with a still portrait) nothing does.
+        """
+        if self.frame_state != self.presented_frame_state:
+            rects = None
+        elif self.text_state != self.presented_text_state:
+            rects = [self.dialogue_box_rect]
+        else:
+            rects = []
+        self.presented_frame_state = self.frame_state
+        self.presented_text_state = self.text_state
+        return rects
+        
     def _draw_dialogue_system(self, surface):
         """Draw the complete dialogue system."""
         if self.dialogue_index >= len(self.dialogue_sequence):
             return
             
-        current = self.dialogue_sequence[self.dialogue_index]
-        character_data = self.characters.get(current['character'], {})
+        index = self.dialogue_index
         
         # Draw character portrait
-        self._draw_character_portrait(surface, current['character'], current.get('emotion', 'normal'))
+        self._draw_character_portrait(surface, self.dialogue_characters[index],
+                                      self.dialogue_emotions[index])
         
         # Draw dialogue box
-        self._draw_dialogue_box(surface, current, character_data)
+        self._draw_dialogue_box(surface, index)
         
         # Draw subtitles if enabled
         if self.show_subtitles:
-            self._draw_subtitles(surface, current)
+            self._draw_subtitles(surface, index)
             
         # Draw choices if available
         if self.choices_available:
@@ -610,210 +940,179 @@ class EnhancedStoryScene(State):
         
     def _draw_character_portrait(self, surface, character: str, emotion: str):
         """Draw character portrait with animations."""
-        character_data = self.characters.get(character, {})
-        colors = character_data.get('portrait_colors', {})
-        
-        # Portrait position
-        portrait_x = 100
-        portrait_y = WINDOW_HEIGHT // 2 - 100
-        portrait_size = 150
+        character_data = self._get_character(character)
         
         # Draw portrait background circle
-        pygame.draw.circle(surface, (40, 40, 50), (portrait_x + portrait_size // 2, portrait_y + portrait_size // 2), 
-                         portrait_size // 2 + 10)
-        pygame.draw.circle(surface, COLOR_BLUE, (portrait_x + portrait_size // 2, portrait_y + portrait_size // 2), 
-                         portrait_size // 2 + 10, 3)
+        surface.blit(self.portrait_frame, self.portrait_frame_pos)
         
         # Draw character (simplified pixel art style)
-        self._draw_character_sprite(surface, portrait_x, portrait_y, portrait_size, colors, emotion)
+        bounce = int(math.sin(self.portrait_animation * 4) * 3) if emotion == 'excited' else 0
+        self.portrait_bounce = bounce
+        sprite = self._get_portrait_sprite(character, character_data, emotion, bounce,
+                                           self.portrait_rect.width)
+        surface.blit(sprite, self.portrait_rect)
+        
+        # Draw character name and role
+        surface.blit(character_data.name_surf, self.name_pos)
+        surface.blit(character_data.role_surf, self.role_pos)
         
-        # Draw character name
-        name = character_data.get('name', character)
-        role = character_data.get('role', '')
+    def _create_portrait_frame(self, portrait_size: int = 150) -> pygame.Surface:
+        """Pre-render the circular portrait background and its border."""
+        radius = portrait_size // 2 + 10
+        frame = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(frame, (40, 40, 50), (radius, radius), radius)
+        pygame.draw.circle(frame, COLOR_BLUE, (radius, radius), radius, 3)
+        return _display_format(frame)
         
-        name_surf = self.font_name.render(name, True, self.colors['name_text'])
-        surface.blit(name_surf, (portrait_x - 20, portrait_y + portrait_size + 20))
+    def _create_dialogue_box(self) -> pygame.Surface:
+        """Pre-render the semi-transparent dialogue box and its border."""
+        box_surf = pygame.Surface(self.dialogue_box_rect.size, pygame.SRCALPHA)
+        box_surf.fill(self.box_color)
+        pygame.draw.rect(box_surf, self.border_color, box_surf.get_rect(), 3)
+        return _display_format(box_surf)
         
-        role_surf = self.font_small.render(role, True, self.colors['subtitle'])
-        surface.blit(role_surf, (portrait_x - 20, portrait_y + portrait_size + 50))
+    def _warm_portrait_cache(self):
+        """Pre-render every portrait pose used by the current sequence."""
+        size = self.portrait_rect.width
+        for character, emotion in set(zip(self.dialogue_characters, self.dialogue_emotions)):
+            character_data = self._get_character(character)
+            # The excited hair bounce is int(sin * 3), so it spans -3..3
+            bounces = range(-3, 4) if emotion == 'excited' else (0,)
+            for bounce in bounces:
+                self._get_portrait_sprite(character, character_data, emotion, bounce, size)
+                
+    def _get_portrait_sprite(self, character: str, character_data: StoryCharacter,
+                             emotion: str, bounce: int, size: int) -> pygame.Surface:
+        """Return the cached sprite for a character pose.
+
+        The excited hair bounce only takes a handful of integer offsets, so
+        each offset gets its own cached sprite.
+        """
+        key = (character, emotion, bounce)
+        sprite = self.portrait_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            self._draw_character_sprite(sprite, 0, 0, size, character_data, emotion, bounce)
+            sprite = _display_format(sprite)
+            self.portrait_sprites[key] = sprite
+        return sprite
         
-    def _draw_character_sprite(self, surface, x, y, size, colors, emotion):
+    def _draw_character_sprite(self, surface, x, y, size, character_data, emotion, bounce=0):
         """Draw simplified character sprite."""
+        draw = pygame.draw
+        skin, hair_color, uniform, accent = character_data.palette
         center_x = x + size // 2
         center_y = y + size // 2
         
         # Head
         head_size = size // 4
-        head_color = colors.get('skin', (220, 200, 180))
-        pygame.draw.circle(surface, head_color, (center_x, center_y - size // 4), head_size)
+        head_y = center_y - head_size
+        draw.circle(surface, skin, (center_x, head_y), head_size)
         
         # Hair (based on character)
-        hair_color = colors.get('hair', (100, 100, 100))
         if emotion == 'excited':
             # Hair bouncing
-            bounce = int(math.sin(self.portrait_animation * 4) * 3)
-            pygame.draw.ellipse(surface, hair_color, 
-                              (center_x - head_size, center_y - size // 4 - bounce - head_size // 2, 
-                               head_size * 2, head_size))
+            draw.ellipse(surface, hair_color, 
+                         (center_x - head_size, head_y - bounce - head_size // 2, 
+                          head_size * 2, head_size))
         else:
-            pygame.draw.ellipse(surface, hair_color, 
-                              (center_x - head_size, center_y - size // 4 - head_size // 2, 
-                               head_size * 2, head_size))
+            draw.ellipse(surface, hair_color, 
+                         (center_x - head_size, head_y - head_size // 2, 
+                          head_size * 2, head_size))
         
         # Body
         body_height = size // 2
-        body_color = colors.get('uniform', COLOR_BLUE)
-        pygame.draw.rect(surface, body_color, 
-                        (center_x - size // 3, center_y - size // 6, size // 3 * 2, body_height))
+        draw.rect(surface, uniform, 
+                  (center_x - size // 3, center_y - size // 6, size // 3 * 2, body_height))
         
         # Accent/insignia
-        accent_color = colors.get('accent', COLOR_GOLD)
-        pygame.draw.rect(surface, accent_color, 
-                        (center_x - size // 4, center_y - size // 8, size // 2, 10))
+        draw.rect(surface, accent, 
+                  (center_x - head_size, center_y - size // 8, size // 2, 10))
         
         # Eyes (animated)
         eye_color = (60, 60, 80)
         if emotion == 'excited':
             # Sparkling eyes
-            pygame.draw.circle(surface, eye_color, (center_x - 8, center_y - size // 4), 3)
-            pygame.draw.circle(surface, eye_color, (center_x + 8, center_y - size // 4), 3)
-            pygame.draw.circle(surface, (255, 255, 255), (center_x - 6, center_y - size // 4 - 2), 1)
-            pygame.draw.circle(surface, (255, 255, 255), (center_x + 10, center_y - size // 4 - 2), 1)
+            draw.circle(surface, eye_color, (center_x - 8, head_y), 3)
+            draw.circle(surface, eye_color, (center_x + 8, head_y), 3)
+            draw.circle(surface, (255, 255, 255), (center_x - 6, head_y - 2), 1)
+            draw.circle(surface, (255, 255, 255), (center_x + 10, head_y - 2), 1)
         else:
-            pygame.draw.circle(surface, eye_color, (center_x - 8, center_y - size // 4), 2)
-            pygame.draw.circle(surface, eye_color, (center_x + 8, center_y - size // 4), 2)
+            draw.circle(surface, eye_color, (center_x - 8, head_y), 2)
+            draw.circle(surface, eye_color, (center_x + 8, head_y), 2)
             
         # Mouth (based on emotion)
-        if emotion in ['joking', 'excited']:
+        if emotion in ('joking', 'excited'):
             # Smiling
-            pygame.draw.arc(surface, (200, 100, 100), 
-                           (center_x - 10, center_y - size // 4 + 5, 20, 15), 
-                           0, math.pi, 2)
+            draw.arc(surface, (200, 100, 100), 
+                     (center_x - 10, head_y + 5, 20, 15), 
+                     0, math.pi, 2)
         elif emotion == 'stressed':
             # Frowning
-            pygame.draw.arc(surface, (200, 100, 100), 
-                           (center_x - 10, center_y - size // 4 + 10, 20, 10), 
-                           math.pi, 0, 2)
+            draw.arc(surface, (200, 100, 100), 
+                     (center_x - 10, head_y + 10, 20, 10), 
+                     math.pi, 0, 2)
         else:
             # Neutral
-            pygame.draw.line(surface, (150, 100, 100), 
-                           (center_x - 5, center_y - size // 4 + 10), 
-                           (center_x + 5, center_y - size // 4 + 10), 2)
+            draw.line(surface, (150, 100, 100), 
+                      (center_x - 5, head_y + 10), 
+                      (center_x + 5, head_y + 10), 2)
                            
-    def _draw_dialogue_box(self, surface, dialogue_data, character_data):
+    def _draw_dialogue_box(self, surface, index: int):
         """Draw the dialogue box with animated text."""
-        # Dialogue box dimensions
-        box_x = 300
-        box_y = WINDOW_HEIGHT // 2 - 80
-        box_width = WINDOW_WIDTH - 350
-        box_height = 200
-        
-        # Create semi-transparent surface
-        box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        box_surf.fill(self.colors['dialogue_box'])
-        surface.blit(box_surf, (box_x, box_y))
-        
-        # Draw border
-        pygame.draw.rect(surface, self.colors['border'], (box_x, box_y, box_width, box_height), 3)
-        
-        # Get text with animation
-        full_text = dialogue_data['text']
-        if self.text_animation_progress < 1.0:
-            # Animate text appearance
-            text_length = int(len(full_text) * self.text_animation_progress)
-            display_text = full_text[:text_length]
-        else:
-            display_text = full_text
-            
-        # Word wrap text
-        words = display_text.split(' ')
-        lines = []
-        current_line = []
+        # Number of characters revealed by the text animation; the blit list
+        # only changes when another character is revealed
+        text_length = int(self.chars_shown)
+        key = (index, text_length)
+        if key != self.dialogue_box_key:
+            self.dialogue_box_blits = self._build_dialogue_box_blits(index, text_length)
+            self.dialogue_box_key = key
+        surface.blits(self.dialogue_box_blits, doreturn=False)
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            text_surf = self.font_dialogue.render(test_line, True, self.colors['text'])
-            if text_surf.get_width() > box_width - 40:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-            else:
-                current_line.append(word)
-                
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        # Draw text lines
-        for i, line in enumerate(lines):
-            if i < 6:  # Maximum 6 lines
-                text_surf = self.font_dialogue.render(line, True, self.colors['text'])
-                surface.blit(text_surf, (box_x + 20, box_y + 20 + i * 30))
-                
-        # Draw continue prompt if text is fully displayed
-        if self.text_animation_progress >= 1.0:
-            prompt_alpha = int(abs(math.sin(self.portrait_animation * 2)) * 255)
-            prompt_surf = self.font_small.render("Press SPACE or click to continue...", True, 
-                                                (*self.colors['subtitle'], prompt_alpha))
-            surface.blit(prompt_surf, (box_x + 20, box_y + box_height - 30))
-            
-    def _draw_subtitles(self, surface, dialogue_data):
-        """Draw subtitles at the bottom of the screen."""
-        subtitle_text = dialogue_data['text']
-        
-        # Word wrap for subtitles
-        words = subtitle_text.split(' ')
-        lines = []
-        current_line = []
+    def _build_dialogue_box_blits(self, index: int, text_length: int) -> List[Tuple]:
+        """Return the blit list of the dialogue box with text_length
+        characters of the current entry revealed."""
+        # Semi-transparent box with its border
+        blits = [(self.dialogue_box_surf, self.dialogue_box_rect)]
         
-        max_width = WINDOW_WIDTH - 100
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            text_surf = self.font_subtitle.render(test_line, True, (0, 0, 0))
-            if text_surf.get_width() > max_width:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
+        # The pre-rendered lines, clipping the one being typed
+        lines = self.dialogue_lines[index]
+        starts = self.dialogue_line_starts[index]
+        offsets = self.dialogue_line_offsets[index]
+        for i, line_surf in enumerate(self.dialogue_line_surfs[index]):
+            shown = text_length - starts[i]
+            if shown <= 0:
+                break
+            line_pos = self.dialogue_line_positions[i]
+            if shown >= len(lines[i]):
+                blits.append((line_surf, line_pos))
             else:
-                current_line.append(word)
+                blits.append((line_surf, line_pos,
+                              (0, 0, offsets[i][shown], line_surf.get_height())))
                 
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Continue prompt once the text is fully displayed
+        # (font.render ignores the alpha channel of the color, so the prompt
+        # is cached once in the opaque subtitle color)
+        if text_length >= self.chars_target:
+            prompt_surf = self._render_cached(self.font_small, "Press SPACE or click to continue...",
+                                              self.prompt_color)
+            blits.append((prompt_surf, self.prompt_pos))
+        return blits
             
-        # Draw subtitle background
-        subtitle_height = len(lines) * 20 + 20
-        subtitle_y = WINDOW_HEIGHT - subtitle_height - 20
-        
-        bg_surf = pygame.Surface((WINDOW_WIDTH - 40, subtitle_height), pygame.SRCALPHA)
-        bg_surf.fill((0, 0, 0, 180))
-        surface.blit(bg_surf, (20, subtitle_y))
-        
-        # Draw subtitle text
-        for i, line in enumerate(lines):
-            text_surf = self.font_subtitle.render(line, True, self.colors['text'])
-            text_rect = text_surf.get_rect(center=(WINDOW_WIDTH // 2, subtitle_y + 15 + i * 20))
-            surface.blit(text_surf, text_rect)
+    def _draw_subtitles(self, surface, index: int):
+        """Draw subtitles at the bottom of the screen."""
+        surface.blits(self.subtitle_blits[index], doreturn=False)
             
     def _draw_choices(self, surface):
         """Draw dialogue choice buttons."""
-        choice_y = WINDOW_HEIGHT - 200
-        
-        for i, choice in enumerate(self.choices_available):
-            # Create choice button
-            choice_button = EnhancedRetroButton(
-                WINDOW_WIDTH // 2 - 150, choice_y + i * 40, 300, 35,
-                choice,
-                color=self.colors['choices'] if i == self.selected_choice else (60, 60, 60)
-            )
+        for i, choice_button in enumerate(self.choice_buttons):
+            choice_button.color = self.choice_color if i == self.selected_choice else (60, 60, 60)
             choice_button.draw(surface)
             
     def _draw_progress(self, surface):
         """Draw dialogue progress indicator."""
         progress_text = f"{self.dialogue_index + 1}/{len(self.dialogue_sequence)}"
-        progress_surf = self.font_small.render(progress_text, True, self.colors['progress'])
+        progress_surf = self._render_cached(self.font_small, progress_text, self.progress_color)
         surface.blit(progress_surf, (WINDOW_WIDTH - 80, 50))
         
         # Draw progress bar
@@ -822,7 +1121,7 @@ class EnhancedStoryScene(State):
         bar_x = WINDOW_WIDTH - 120
         bar_y = 70
         
-        pygame.draw.rect(surface, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
+        surface.fill((60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
         progress = (self.dialogue_index + 1) / len(self.dialogue_sequence)
         fill_width = int(bar_width * progress)
-        pygame.draw.rect(surface, COLOR_GOLD, (bar_x, bar_y, fill_width, bar_height))
\ No newline at end of file
+        surface.fill(COLOR_GOLD, (bar_x, bar_y, fill_width, bar_height))
\ No newline at end of file
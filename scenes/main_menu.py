@@ -14,7 +14,7 @@ from core.colors import (
     DARK_GRAPHITE_BLACK, RETRO_PIXEL_AMBER, DEEP_SIGNAL_BLUE,
     SILVER_STEEL, NEON_COMPETENCE_CYAN, GOLD_EXCELLENCE
 )
-from ui.components import RetroButton, TextRenderer
+from ui.components import RetroButton, TextRenderer, display_format
 from core.animations import SparkleEffect, AnimationManager
 
 
@@ -45,6 +45,11 @@ class MainMenuScene:
         self.star_timer = 0
         self.star_visible = False
         
+        # The gradient, crowd and star never change, so render them once
+        self.background_surface = self._create_background()
+        self.crowd_strip = self._create_crowd_strip()
+        self.star_surface = self._create_star()
+        
         self._create_buttons()
     
     def _create_buttons(self):
@@ -117,33 +122,84 @@ class MainMenuScene:
         print("Quit button clicked")
         # In a real implementation, this would exit the game
     
-    def _draw_background(self, surface):
-        """Draw the gradient background with crowd silhouettes."""
-        # Draw gradient background
+    def _create_background(self):
+        """Render the vertical gradient background to a surface.
+
+        The row colors are packed into a one pixel wide RGB column, which a
+        single scale call stretches across the screen width.
+        """
+        column = bytearray()
         for y in range(self.screen_height):
             # Calculate interpolation factor
             factor = y / self.screen_height
             r = int(self.bottom_color.r * (1 - factor) + self.top_color.r * factor)
             g = int(self.bottom_color.g * (1 - factor) + self.top_color.g * factor)
             b = int(self.bottom_color.b * (1 - factor) + self.top_color.b * factor)
-            
-            pygame.draw.line(surface, (r, g, b), (0, y), (self.screen_width, y))
+            column += bytes((r, g, b))
         
-        # Draw crowd silhouettes (simplified implementation)
+        column_surface = pygame.image.frombuffer(bytes(column), (1, self.screen_height), 'RGB')
+        background = pygame.transform.scale(column_surface, (self.screen_width, self.screen_height))
+        return display_format(background, alpha=False)
+    
+    def _create_crowd_strip(self):
+        """
+        Render one scroll period of crowd silhouettes.
+        
+        The strip is one screen width plus one crowd spacing wide, so two
+        copies side by side cover the screen at any scroll offset.
+        """
         crowd_color = pygame.Color(0, 0, 0, int(255 * 0.1))  # 10% opacity
-        crowd_surface = pygame.Surface((self.screen_width, 50), pygame.SRCALPHA)
+        crowd_surface = pygame.Surface((220, 50), pygame.SRCALPHA)
         pygame.draw.ellipse(crowd_surface, crowd_color, (0, 0, 100, 30))
         pygame.draw.ellipse(crowd_surface, crowd_color, (50, 10, 80, 25))
         pygame.draw.ellipse(crowd_surface, crowd_color, (100, 5, 120, 35))
         
-        # Draw crowd at multiple positions
+        # Crowds every 200 pixels
+        crowd_strip = pygame.Surface((self.screen_width + 200, 50), pygame.SRCALPHA)
         for i in range(5):
-            x_pos = (i * 200 + self.crowd_offset) % (self.screen_width + 200) - 100
-            surface.blit(crowd_surface, (x_pos, self.screen_height - 100))
+            crowd_strip.blit(crowd_surface, (i * 200, 0))
+        return display_format(crowd_strip)
+    
+    def _create_star(self):
+        """Render the 8-bit logo star.
+
+        The surface origin sits at (+88, -27) from the logo center, leaving
+        room for the 2px line width around the star points.
+        """
+        star_surface = pygame.Surface((25, 15), pygame.SRCALPHA)
+        star_points = [
+            (12, 2),   # Top
+            (17, 7),   # Top-right
+            (22, 2),   # Right
+            (17, 7),   # Back to top-right
+            (22, 12),  # Bottom-right
+            (17, 7),   # Back to top-right
+            (12, 12),  # Bottom
+            (17, 7),   # Back to top-right
+            (7, 12),   # Bottom-left
+            (17, 7),   # Back to top-right
+            (2, 2),    # Left
+            (17, 7),   # Back to top-right
+            (7, 7),    # Top-left
+        ]
+        pygame.draw.lines(star_surface, SILVER_STEEL, False, star_points, 2)
+        return display_format(star_surface)
+    
+    def _add_background_blits(self, blits):
+        """Add the gradient background and crowd silhouettes to a blit list."""
+        # Gradient background
+        blits.append((self.background_surface, (0, 0)))
+        
+        # Crowd silhouettes, scrolled by wrapping two copies of the strip
+        strip_width = self.crowd_strip.get_width()
+        x_pos = self.crowd_offset % strip_width - 100
+        crowd_y = self.screen_height - 100
+        blits.append((self.crowd_strip, (x_pos - strip_width, crowd_y)))
+        blits.append((self.crowd_strip, (x_pos, crowd_y)))
     
-    def _draw_logo(self, surface):
-        """Draw the game logo with star animation."""
-        # Draw "Pride of Code" text with outline
+    def _add_logo_blits(self, blits):
+        """Add the game logo with star animation to a blit list."""
+        # "Pride of Code" text with outline
         logo_text = self.text_renderer.render_text(
             "PRIDE OF CODE", 
             style='title', 
@@ -151,7 +207,7 @@ class MainMenuScene:
             outline=True
         )
         logo_rect = logo_text.get_rect(center=(self.screen_width // 2, 150))
-        surface.blit(logo_text, logo_rect)
+        blits.append((logo_text, logo_rect))
         
         # Draw star animation
         self.star_timer += 1
@@ -168,24 +224,8 @@ class MainMenuScene:
                 self.animation_manager.add_animation(sparkle)
         
         if self.star_visible:
-            # Draw simple 8-bit star
-            star_points = [
-                (logo_rect.centerx + 100, logo_rect.centery - 25),  # Top
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Top-right
-                (logo_rect.centerx + 110, logo_rect.centery - 25),  # Right
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 110, logo_rect.centery - 15),  # Bottom-right
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 100, logo_rect.centery - 15),  # Bottom
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 95, logo_rect.centery - 15),   # Bottom-left
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 90, logo_rect.centery - 25),   # Left
-                (logo_rect.centerx + 105, logo_rect.centery - 20),  # Back to top-right
-                (logo_rect.centerx + 95, logo_rect.centery - 20),   # Top-left
-            ]
-            
-            pygame.draw.lines(surface, SILVER_STEEL, False, star_points, 2)
+            # Simple 8-bit star
+            blits.append((self.star_surface, (logo_rect.centerx + 88, logo_rect.centery - 27)))
     
     def handle_event(self, event):
         """Handle pygame events."""
@@ -206,15 +246,13 @@ class MainMenuScene:
     
     def draw(self, surface):
         """Draw the main menu scene."""
-        # Draw background
-        self._draw_background(surface)
-        
-        # Draw logo
-        self._draw_logo(surface)
-        
-        # Draw buttons
+        # Background, logo and buttons, drawn in one batch
+        blits = []
+        self._add_background_blits(blits)
+        self._add_logo_blits(blits)
         for button in self.buttons:
-            button.draw(surface)
+            blits.extend(button.get_blits())
+        surface.blits(blits, doreturn=False)
         
         # Draw animations
         self.animation_manager.draw(surface)
\ No newline at end of file
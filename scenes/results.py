@@ -1,17 +1,69 @@
+import bisect
 import math
 import pygame
+from typing import List, Optional
 from core.state_manager import State
-from config import COLOR_BLUE, COLOR_GOLD, COLOR_TEXT, COLOR_BG
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, COLOR_BLUE, COLOR_GOLD, COLOR_TEXT, COLOR_BG
 from ui.enhanced_retro_button import EnhancedRetroButton
 
+# Direction of every whole degree of the score meter, clockwise from the top
+_ARC_COS = tuple(math.cos(math.radians(i - 90)) for i in range(361))
+_ARC_SIN = tuple(math.sin(math.radians(i - 90)) for i in range(361))
+
+# First degree of each score meter color band (0, 60, 70, 80 and 90 percent)
+_ARC_BAND_STARTS = (0, 216, 252, 288, 324, 360)
+
+# Center height and outer radius of the score meter
+METER_CENTER_Y = 220
+METER_RADIUS = 80
+
+# Center of the trophy shown next to high ratings
+TROPHY_POS = (WINDOW_WIDTH // 2 + 200, 450)
+
+# Minimum total score of each rating above the lowest one, and the rating
+# text and color for each tier from lowest to highest
+_RATING_THRESHOLDS = (60, 70, 80, 90)
+_RATING_TABLE = (
+    ("NEEDS IMPROVEMENT", (220, 20, 60)),   # Crimson
+    ("FAIR", (255, 140, 0)),                # Dark orange
+    ("GOOD!", (100, 149, 237)),             # Cornflower blue
+    ("EXCELLENT!", (144, 238, 144)),        # Light green
+    ("OUTSTANDING!", COLOR_GOLD),           # Gold
+)
+
+# Color of the sparkle above the trophy
+_SPARKLE_COLOR = (255, 255, 255)
+
+# Angular spacing of the five particles circling a high score
+_PARTICLE_PHASES = tuple(i * (2 * math.pi / 5) for i in range(5))
+
+
+def _display_format(surf: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display pixel format for fast blitting.
+
+    Surfaces are returned unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
 
 class ResultsScene(State):
     def __init__(self, manager, game):
         self.manager = manager
         self.game = game
-        self.font = pygame.font.SysFont('arial', 24)
-        self.font_large = pygame.font.SysFont('arial', 36, bold=True)
-        self.font_small = pygame.font.SysFont('arial', 18)
+        
+        # Fonts (pygame's default font needs no system font lookup; the
+        # large one is made bold with set_bold())
+        try:
+            self.font = pygame.font.Font(None, 24)
+            self.font_large = pygame.font.Font(None, 36)
+            self.font_large.set_bold(True)
+            self.font_small = pygame.font.Font(None, 18)
+        except (OSError, pygame.error):
+            # Fallback to system fonts
+            self.font = pygame.font.SysFont('arial', 24)
+            self.font_large = pygame.font.SysFont('arial', 36, bold=True)
+            self.font_small = pygame.font.SysFont('arial', 18)
         
         # Results data
         self.scores = {}
@@ -33,12 +85,42 @@ class ResultsScene(State):
             'stadium_gray': (80, 80, 90)    # Stadium gray
         }
         
-        # UI elements
+        # Score color of every whole percentage
+        self.score_color_table = tuple(
+            self.colors['gold'] if score >= 90 else
+            self.colors['success'] if score >= 80 else
+            self.colors['creativity'] if score >= 70 else
+            (255, 140, 0) if score >= 60 else
+            (220, 20, 60)
+            for score in range(101)
+        )
+        
+        # UI elements; the buttons don't depend on the results, so they
+        # are built once and kept across visits
         self.buttons = []
+        self._create_buttons()
         
         # Animation
         self.animation_time = 0.0
         
+        # Everything that stays still while a set of results is shown, composed
+        # on first draw, and the trophy without its animated sparkle
+        self.static_surface = None
+        self.presented_static_surface = None
+        self.trophy_surface = self._create_trophy()
+        
+        # Particle (dx, dy, size) offsets and the animation time they are for,
+        # and the particle sprites of each score color keyed by radius
+        self.particle_offsets = []
+        self.particle_offsets_time = None
+        self.particle_sprites = {
+            color: {radius: self._create_particle_sprite(color, radius) for radius in range(2, 6)}
+            for color in (self.colors['success'], self.colors['creativity'], self.colors['performance'])
+        }
+        
+        # Text that only changes on enter(), rendered once
+        self._render_static_text()
+        
     def enter(self, **params):
         """Called when entering this state."""
         # Get results data
@@ -48,14 +130,14 @@ class ResultsScene(State):
         self.moves_completed = params.get('moves_completed', 0)
         self.sync_rate = params.get('sync_rate', 0)
         
-        # Create UI elements
-        self._create_buttons()
+        # Render the text for these results
+        self._render_static_text()
         
     def _create_buttons(self):
         """Create navigation buttons."""
         button_width = 200
         button_height = 50
-        button_x = pygame.display.get_surface().get_width() // 2 - button_width // 2
+        button_x = WINDOW_WIDTH // 2 - button_width // 2
         start_y = 500
         spacing = 70
         
@@ -64,22 +146,110 @@ class ResultsScene(State):
                 button_x, start_y, button_width, button_height,
                 "NEXT WEEK",
                 color=self.colors['blue'],
-                on_click=lambda: self._next_week()
+                on_click=self._next_week
             ),
             EnhancedRetroButton(
                 button_x, start_y + spacing, button_width, button_height,
                 "RETRY",
                 color=(100, 100, 100),
-                on_click=lambda: self._retry()
+                on_click=self._retry
             ),
             EnhancedRetroButton(
                 button_x, start_y + spacing * 2, button_width, button_height,
                 "MAIN MENU",
                 color=(120, 40, 40),
-                on_click=lambda: self._main_menu()
+                on_click=self._main_menu
             )
         ]
         
+    def _render_static_text(self):
+        """Pre-render the titles, scores, stats and rating as (surface, rect) pairs."""
+        center_x = WINDOW_WIDTH // 2
+        text_color = self.colors['text']
+        self.text_blits = {}
+        
+        # Title and score summary
+        title = _display_format(self.font_large.render("PERFORMANCE RESULTS", True, self.colors['gold']))
+        self.text_blits['title'] = (title, title.get_rect(center=(center_x, 60)))
+        score_surf = _display_format(self.font_large.render(
+            f"TOTAL SCORE: {self.total_score:.1f}%", True, text_color))
+        self.text_blits['score'] = (score_surf, score_surf.get_rect(center=(center_x, 120)))
+        
+        # Score in the center of the meter and its percentage sign
+        meter_surf = _display_format(self.font_large.render(f"{self.total_score:.0f}", True, text_color))
+        self.text_blits['meter_score'] = (meter_surf, meter_surf.get_rect(center=(center_x, METER_CENTER_Y)))
+        percent_surf = _display_format(self.font.render("%", True, text_color))
+        self.text_blits['percent'] = (percent_surf, (center_x + 30, METER_CENTER_Y - 10))
+        
+        # Score meter arc
+        self.arc_polygons = self._create_score_arc(center_x, METER_CENTER_Y, METER_RADIUS)
+        
+        # Individual score labels, values and progress bars, and where the
+        # particles of high scores circle with the sprites of their color
+        self.score_row_blits = []
+        self.score_particle_anchors = []
+        if self.scores:
+            score_items = [
+                ('Correctness', self.scores.get('correctness', 0), self.colors['success']),
+                ('Creativity', self.scores.get('creativity', 0), self.colors['creativity']),
+                ('Performance', self.scores.get('performance', 0), self.colors['performance'])
+            ]
+            bar_width = 400
+            bar_height = 20
+            bar_x = 400
+            y_pos = 180
+            for label, score, color in score_items:
+                label_surf = _display_format(self.font.render(f"{label}:", True, text_color))
+                value_surf = _display_format(self.font.render(f"{score:.1f}%", True, color))
+                
+                bar_surf = pygame.Surface((bar_width, bar_height))
+                bar_surf.fill((40, 40, 50))
+                fill_width = int((score / 100.0) * bar_width)
+                pygame.draw.rect(bar_surf, color, (0, 0, fill_width, bar_height))
+                pygame.draw.rect(bar_surf, text_color, (0, 0, bar_width, bar_height), 2)
+                
+                self.score_row_blits.extend([
+                    (label_surf, (100, y_pos)),
+                    (value_surf, (300, y_pos)),
+                    (_display_format(bar_surf, alpha=False), (bar_x, y_pos))
+                ])
+                if score > 80:
+                    self.score_particle_anchors.append(
+                        (bar_x + fill_width, y_pos + bar_height // 2, self.particle_sprites[color]))
+                y_pos += 40
+                
+        # Additional stats, rendered as one block of lines 30 pixels apart
+        stats = [
+            f"Performance Time: {self.performance_time:.1f}s",
+            f"Moves Completed: {self.moves_completed}",
+            f"Sync Rate: {self.sync_rate:.1f}%"
+        ]
+        stat_surfs = [self.font_small.render(stat, True, (180, 180, 180)) for stat in stats]
+        stats_surf = pygame.Surface(
+            (max(surf.get_width() for surf in stat_surfs), (len(stat_surfs) - 1) * 30 + stat_surfs[-1].get_height()),
+            pygame.SRCALPHA)
+        stats_surf.blits([(surf, (0, i * 30)) for i, surf in enumerate(stat_surfs)], doreturn=False)
+        self.text_blits['stats'] = (_display_format(stats_surf), (100, 350))
+        
+        # Performance rating
+        rating, rating_color = _RATING_TABLE[bisect.bisect_right(_RATING_THRESHOLDS, self.total_score)]
+        rating_surf = _display_format(self.font_large.render(rating, True, rating_color))
+        self.text_blits['rating'] = (rating_surf, rating_surf.get_rect(center=(center_x, 450)))
+        
+        # Keyboard instructions
+        instructions = _display_format(self.font_small.render(
+            "ENTER: Next Week | R: Retry | ESC: Main Menu", True, (100, 100, 100)))
+        self.text_blits['instructions'] = (instructions, instructions.get_rect(center=(center_x, WINDOW_HEIGHT - 30)))
+        
+        # The static composite shows the previous results until redrawn, and
+        # only the buttons, particles and trophy sparkle change between frames
+        self.static_surface = None
+        self.animated_rects = [button.rect.inflate(30, 30) for button in self.buttons]
+        self.animated_rects.extend(pygame.Rect(x - 21, y - 21, 42, 42)
+                                   for x, y, sprites in self.score_particle_anchors)
+        if self.total_score >= 80:
+            self.animated_rects.append(pygame.Rect(TROPHY_POS[0] - 6, TROPHY_POS[1] - 36, 12, 12))
+        
     def _next_week(self):
         """Go to the next week."""
         # For now, just go back to level select
@@ -117,192 +287,170 @@ class ResultsScene(State):
             
     def draw(self, surface):
         """Draw the results screen."""
-        surface.fill(self.colors['background'])
+        # Draw everything that doesn't animate
+        if self.static_surface is None or self.static_surface.get_size() != surface.get_size():
+            self.static_surface = self._create_static_surface(surface.get_size())
+        surface.blit(self.static_surface, (0, 0))
         
-        # Draw stadium decorations
-        self._draw_stadium_decorations(surface)
+        # Draw animated particles for high scores
+        for x, y, sprites in self.score_particle_anchors:
+            self._draw_score_particles(surface, x, y, sprites)
+            
+        # Draw trophy sparkle for high scores
+        if self.total_score >= 80:
+            self._draw_trophy_sparkle(surface, *TROPHY_POS)
+            
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+            
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Report the animated areas drawn over the static composite, or
+        the whole screen when the composite itself was redrawn."""
+        if self.static_surface is not self.presented_static_surface:
+            self.presented_static_surface = self.static_surface
+            return None
+        return self.animated_rects
         
-        # Draw title
-        title = self.font_large.render("PERFORMANCE RESULTS", True, self.colors['gold'])
-        title_rect = title.get_rect(center=(surface.get_width() // 2, 60))
-        surface.blit(title, title_rect)
+    def _create_static_surface(self, size) -> pygame.Surface:
+        """Compose the background, text, score meter, bars and trophy of the
+        current results."""
+        static = pygame.Surface(size)
+        static.fill(self.colors['background'])
         
-        # Draw score summary with animation
-        score_text = f"TOTAL SCORE: {self.total_score:.1f}%"
-        score_surf = self.font_large.render(score_text, True, self.colors['text'])
-        score_rect = score_surf.get_rect(center=(surface.get_width() // 2, 120))
-        surface.blit(score_surf, score_rect)
+        # Stadium decorations
+        self._draw_stadium_decorations(static)
         
-        # Draw animated score meter
-        self._draw_score_meter(surface)
+        # Title and score summary
+        static.blit(*self.text_blits['title'])
+        static.blit(*self.text_blits['score'])
         
-        # Draw individual scores
-        if self.scores:
-            y_pos = 180
-            score_items = [
-                ('Correctness', self.scores.get('correctness', 0), self.colors['success']),
-                ('Creativity', self.scores.get('creativity', 0), self.colors['creativity']),
-                ('Performance', self.scores.get('performance', 0), self.colors['performance'])
-            ]
-            
-            for label, score, color in score_items:
-                # Draw label
-                label_surf = self.font.render(f"{label}:", True, self.colors['text'])
-                surface.blit(label_surf, (100, y_pos))
-                
-                # Draw score
-                score_surf = self.font.render(f"{score:.1f}%", True, color)
-                surface.blit(score_surf, (300, y_pos))
-                
-                # Draw progress bar
-                bar_width = 400
-                bar_height = 20
-                bar_x = 400
-                pygame.draw.rect(surface, (40, 40, 50), (bar_x, y_pos, bar_width, bar_height))
-                fill_width = int((score / 100.0) * bar_width)
-                pygame.draw.rect(surface, color, (bar_x, y_pos, fill_width, bar_height))
-                pygame.draw.rect(surface, self.colors['text'], (bar_x, y_pos, bar_width, bar_height), 2)
-                
-                # Draw animated particles for high scores
-                if score > 80:
-                    self._draw_score_particles(surface, bar_x + fill_width, y_pos + bar_height//2, color)
-                
-                y_pos += 40
-                
-        # Draw additional stats
-        stats_y = 350
-        stats = [
-            f"Performance Time: {self.performance_time:.1f}s",
-            f"Moves Completed: {self.moves_completed}",
-            f"Sync Rate: {self.sync_rate:.1f}%"
-        ]
+        # Score meter
+        self._draw_score_meter(static)
         
-        for i, stat in enumerate(stats):
-            stat_surf = self.font_small.render(stat, True, (180, 180, 180))
-            surface.blit(stat_surf, (100, stats_y + i * 30))
-            
-        # Draw performance rating
-        rating_y = 450
-        if self.total_score >= 90:
-            rating = "OUTSTANDING!"
-            rating_color = self.colors['gold']  # Gold
-        elif self.total_score >= 80:
-            rating = "EXCELLENT!"
-            rating_color = (144, 238, 144)  # Light green
-        elif self.total_score >= 70:
-            rating = "GOOD!"
-            rating_color = (100, 149, 237)  # Cornflower blue
-        elif self.total_score >= 60:
-            rating = "FAIR"
-            rating_color = (255, 140, 0)  # Dark orange
-        else:
-            rating = "NEEDS IMPROVEMENT"
-            rating_color = (220, 20, 60)  # Crimson
-            
-        rating_surf = self.font_large.render(rating, True, rating_color)
-        rating_rect = rating_surf.get_rect(center=(surface.get_width() // 2, rating_y))
-        surface.blit(rating_surf, rating_rect)
+        # Individual scores and additional stats
+        static.blits(self.score_row_blits, doreturn=False)
+        static.blit(*self.text_blits['stats'])
         
-        # Draw animated trophy for high scores
+        # Performance rating, with the trophy for high scores
+        static.blit(*self.text_blits['rating'])
         if self.total_score >= 80:
-            self._draw_trophy(surface, surface.get_width() // 2 + 200, rating_y)
-            
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+            static.blit(self.trophy_surface, (TROPHY_POS[0] - 25, TROPHY_POS[1] - 20))
             
-        # Draw instructions
-        instructions = self.font_small.render("ENTER: Next Week | R: Retry | ESC: Main Menu", True, (100, 100, 100))
-        instructions_rect = instructions.get_rect(center=(surface.get_width() // 2, surface.get_height() - 30))
-        surface.blit(instructions, instructions_rect)
+        # Instructions
+        static.blit(*self.text_blits['instructions'])
+        return _display_format(static, alpha=False)
         
     def _draw_stadium_decorations(self, surface):
         """Draw stadium decorations in the background."""
         # Draw field lines
+        width = surface.get_width()
+        field_green = self.colors['field_green']
         for y in range(100, 600, 40):
-            pygame.draw.line(surface, self.colors['field_green'], (0, y), (surface.get_width(), y), 1)
+            pygame.draw.line(surface, field_green, (0, y), (width, y), 1)
             
         # Draw stadium tiers
+        stadium_gray = self.colors['stadium_gray']
         for i in range(5):
             tier_width = 300 - i * 40
-            pygame.draw.rect(surface, self.colors['stadium_gray'], 
-                           (surface.get_width() // 2 - tier_width // 2, 30 + i * 10, tier_width, 8))
+            pygame.draw.rect(surface, stadium_gray, (width // 2 - tier_width // 2, 30 + i * 10, tier_width, 8))
             
+    def _create_score_arc(self, center_x, center_y, radius):
+        """Return the (color, points) polygons of the score arc, one per color band."""
+        polygons = []
+        if self.total_score > 0:
+            degrees = min(int((self.total_score / 100.0) * 360), 360)
+            inner_radius = radius - 10
+            for band in range(len(_ARC_BAND_STARTS) - 1):
+                start = _ARC_BAND_STARTS[band]
+                if start >= degrees:
+                    break
+                end = min(_ARC_BAND_STARTS[band + 1], degrees)
+                points = [(center_x + radius * _ARC_COS[i], center_y + radius * _ARC_SIN[i])
+                          for i in range(start, end + 1)]
+                points.extend((center_x + inner_radius * _ARC_COS[i], center_y + inner_radius * _ARC_SIN[i])
+                              for i in range(end, start - 1, -1))
+                polygons.append((self._get_score_color(start / 360.0 * 100), points))
+        return polygons
+        
     def _draw_score_meter(self, surface):
         """Draw an animated score meter."""
-        center_x = surface.get_width() // 2
-        center_y = 220
-        radius = 80
+        center_x = WINDOW_WIDTH // 2
+        center_y = METER_CENTER_Y
+        radius = METER_RADIUS
         
         # Draw meter background
         pygame.draw.circle(surface, (40, 40, 50), (center_x, center_y), radius)
         pygame.draw.circle(surface, self.colors['text'], (center_x, center_y), radius, 3)
         
-        # Draw score arc
-        if self.total_score > 0:
-            angle = (self.total_score / 100.0) * 360
-            for i in range(int(angle)):
-                rad = math.radians(i - 90)
-                x1 = center_x + (radius - 10) * math.cos(rad)
-                y1 = center_y + (radius - 10) * math.sin(rad)
-                x2 = center_x + radius * math.cos(rad)
-                y2 = center_y + radius * math.sin(rad)
-                color = self._get_score_color(i / 360.0 * 100)
-                pygame.draw.line(surface, color, (x1, y1), (x2, y2), 3)
+        # Draw score arc, one polygon per color band
+        for color, points in self.arc_polygons:
+            pygame.draw.polygon(surface, color, points)
                 
         # Draw center circle
         pygame.draw.circle(surface, self.colors['background'], (center_x, center_y), radius - 20)
         
         # Draw score in center
-        score_text = f"{self.total_score:.0f}"
-        score_surf = self.font_large.render(score_text, True, self.colors['text'])
-        score_rect = score_surf.get_rect(center=(center_x, center_y))
-        surface.blit(score_surf, score_rect)
+        surface.blit(*self.text_blits['meter_score'])
         
         # Draw percentage sign
-        percent_surf = self.font.render("%", True, self.colors['text'])
-        surface.blit(percent_surf, (center_x + 30, center_y - 10))
+        surface.blit(*self.text_blits['percent'])
         
     def _get_score_color(self, score):
         """Get color based on score."""
-        if score >= 90:
-            return self.colors['gold']
-        elif score >= 80:
-            return self.colors['success']
-        elif score >= 70:
-            return self.colors['creativity']
-        elif score >= 60:
-            return (255, 140, 0)
-        else:
-            return (220, 20, 60)
-            
-    def _draw_score_particles(self, surface, x, y, color):
-        """Draw animated particles for high scores."""
-        for i in range(5):
-            angle = self.animation_time * 2 + i * (2 * math.pi / 5)
-            distance = 5 + abs(math.sin(self.animation_time * 3 + i)) * 10
-            px = x + int(distance * math.cos(angle))
-            py = y + int(distance * math.sin(angle))
+        return self.score_color_table[min(max(int(score), 0), 100)]
             
-            # Pulsing particle
-            pulse = abs(math.sin(self.animation_time * 5 + i))
-            size = int(2 + pulse * 3)
-            
-            pygame.draw.circle(surface, color, (px, py), size)
+    def _get_particle_offsets(self):
+        """Return the (dx, dy, size) of every particle at the current
+        animation time; all score bars share them, so they are computed
+        once per frame."""
+        t = self.animation_time
+        if t != self.particle_offsets_time:
+            offsets = []
+            for i, phase in enumerate(_PARTICLE_PHASES):
+                angle = t * 2 + phase
+                distance = 5 + abs(math.sin(t * 3 + i)) * 10
+                
+                # Pulsing particle
+                pulse = abs(math.sin(t * 5 + i))
+                offsets.append((int(distance * math.cos(angle)), int(distance * math.sin(angle)),
+                                int(2 + pulse * 3)))
+            self.particle_offsets = offsets
+            self.particle_offsets_time = t
+        return self.particle_offsets
+        
+    def _create_particle_sprite(self, color, radius: int) -> pygame.Surface:
+        """Pre-render a particle; its center is radius + 1 pixels from the
+        top left corner."""
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+        return _display_format(sprite)
+        
+    def _draw_score_particles(self, surface, x, y, sprites):
+        """Draw animated particles for high scores with the given sprites
+        keyed by radius."""
+        surface.blits([(sprites[size], (x + dx - size - 1, y + dy - size - 1))
+                       for dx, dy, size in self._get_particle_offsets()], doreturn=False)
             
-    def _draw_trophy(self, surface, x, y):
-        """Draw an animated trophy."""
+    def _create_trophy(self) -> pygame.Surface:
+        """Pre-render the trophy; its center is 25 pixels from the left
+        and 20 pixels from the top of the surface."""
+        trophy = pygame.Surface((50, 45), pygame.SRCALPHA)
+        x, y = 25, 20
+        
         # Trophy base
-        pygame.draw.rect(surface, self.colors['gold'], (x - 15, y + 10, 30, 15))
+        pygame.draw.rect(trophy, self.colors['gold'], (x - 15, y + 10, 30, 15))
         
         # Trophy cup
-        pygame.draw.rect(surface, self.colors['gold'], (x - 10, y - 20, 20, 30))
-        pygame.draw.rect(surface, (255, 255, 255), (x - 10, y - 20, 20, 30), 2)
+        pygame.draw.rect(trophy, self.colors['gold'], (x - 10, y - 20, 20, 30))
+        pygame.draw.rect(trophy, (255, 255, 255), (x - 10, y - 20, 20, 30), 2)
         
         # Trophy handle
-        pygame.draw.rect(surface, self.colors['gold'], (x - 25, y - 10, 10, 5))
-        pygame.draw.rect(surface, self.colors['gold'], (x + 15, y - 10, 10, 5))
+        pygame.draw.rect(trophy, self.colors['gold'], (x - 25, y - 10, 10, 5))
+        pygame.draw.rect(trophy, self.colors['gold'], (x + 15, y - 10, 10, 5))
+        return _display_format(trophy)
         
-        # Animated sparkle
+    def _draw_trophy_sparkle(self, surface, x, y):
+        """Draw the animated sparkle above the trophy centered at (x, y)."""
         sparkle_size = int(3 + abs(math.sin(self.animation_time * 4)) * 2)
-        pygame.draw.circle(surface, (255, 255, 255), (x, y - 30), sparkle_size)
+        pygame.draw.circle(surface, _SPARKLE_COLOR, (x, y - 30), sparkle_size)
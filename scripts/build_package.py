@@ -4,6 +4,7 @@ Build Package Script - Create distributable packages for Code of Pride.
 This module creates distributable packages for different platforms.
 """
 
+import io
 import os
 import sys
 import shutil
@@ -11,6 +12,13 @@ import zipfile
 import tarfile
 from pathlib import Path
 
+# Formats that are already compressed; deflating them again costs time
+# without making the package smaller, so they are stored as-is
+STORED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.ogg', '.mp3', '.zip', '.gz'}
+
+# Fastest deflate level: most of the size win for a fraction of the time
+ZIP_COMPRESSLEVEL = 1
+
 def create_directory_structure():
     """Create the directory structure for the distributable package."""
     # Create base directory
@@ -38,6 +46,14 @@ def create_directory_structure():
         
     return base_dir
 
+def _link_or_copy(src, dst):
+    """Hard link src to dst, copying it when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Different device, or a file system without hard links
+        shutil.copy2(src, dst)
+
 def copy_files(base_dir):
     """Copy necessary files to the distribution directory."""
     # Files to copy
@@ -53,7 +69,7 @@ def copy_files(base_dir):
     # Copy files
     for file_path in files_to_copy:
         if os.path.exists(file_path):
-            shutil.copy2(file_path, os.path.join(base_dir, file_path))
+            _link_or_copy(file_path, os.path.join(base_dir, file_path))
     
     # Copy directories
     dirs_to_copy = [
@@ -68,9 +84,15 @@ def copy_files(base_dir):
         "audio"
     ]
     
+    # The staging tree is only read back by the archivers and then deleted,
+    # so hard links stand in for copies
     for dir_name in dirs_to_copy:
         if os.path.exists(dir_name):
-            shutil.copytree(dir_name, os.path.join(base_dir, dir_name), dirs_exist_ok=True)
+            for root, dirs, files in os.walk(dir_name):
+                dst_dir = os.path.join(base_dir, root)
+                os.makedirs(dst_dir, exist_ok=True)
+                for file in files:
+                    _link_or_copy(os.path.join(root, file), os.path.join(dst_dir, file))
 
 def create_startup_scripts(base_dir):
     """Create platform-specific startup scripts."""
@@ -88,23 +110,42 @@ def create_startup_scripts(base_dir):
     # Make shell script executable
     os.chmod(os.path.join(base_dir, "start_game.sh"), 0o755)
 
-def create_zip_package(base_dir, version="1.0.0"):
-    """Create a ZIP package for Windows."""
-    package_name = f"code-of-pride-windows-{version}.zip"
-    with zipfile.ZipFile(package_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+def create_packages(base_dir, version="1.0.0"):
+    """Create the ZIP package for Windows and the TAR package for macOS/Linux.
+    
+    Both archives are filled during a single walk of the distribution
+    directory, so every file is read only once.
+    """
+    zip_name = f"code-of-pride-windows-{version}.zip"
+    tar_name = f"code-of-pride-unix-{version}.tar.gz"
+    tar_root = os.path.basename(base_dir)
+    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zipf, \
+            tarfile.open(tar_name, "w:gz") as tar:
         for root, dirs, files in os.walk(base_dir):
-            for file in files:
+            dirs.sort()
+            rel_root = os.path.relpath(root, base_dir)
+            
+            # The TAR package keeps directory entries (including empty ones)
+            # under the distribution directory name
+            tar.add(root, arcname=os.path.normpath(os.path.join(tar_root, rel_root)), recursive=False)
+            
+            for file in sorted(files):
                 file_path = os.path.join(root, file)
-                arc_path = os.path.relpath(file_path, base_dir)
-                zipf.write(file_path, arc_path)
-    print(f"Created Windows package: {package_name}")
-
-def create_tar_package(base_dir, version="1.0.0"):
-    """Create a TAR package for macOS/Linux."""
-    package_name = f"code-of-pride-unix-{version}.tar.gz"
-    with tarfile.open(package_name, "w:gz") as tar:
-        tar.add(base_dir, arcname=os.path.basename(base_dir))
-    print(f"Created Unix package: {package_name}")
+                arc_path = os.path.normpath(os.path.join(rel_root, file))
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                
+                if os.path.splitext(file)[1].lower() in STORED_EXTENSIONS:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zipf.writestr(zipfile.ZipInfo.from_file(file_path, arc_path), data,
+                              compress_type=compress_type, compresslevel=ZIP_COMPRESSLEVEL)
+                
+                tarinfo = tar.gettarinfo(file_path, arcname=os.path.join(tar_root, arc_path))
+                tar.addfile(tarinfo, io.BytesIO(data))
+    print(f"Created Windows package: {zip_name}")
+    print(f"Created Unix package: {tar_name}")
 
 def create_installer_script():
     """Create a simple installer script."""
@@ -155,11 +196,8 @@ def main():
         pass
     
     # Create packages
-    print("Creating ZIP package...")
-    create_zip_package(base_dir, version)
-    
-    print("Creating TAR package...")
-    create_tar_package(base_dir, version)
+    print("Creating ZIP and TAR packages...")
+    create_packages(base_dir, version)
     
     # Create installer
     print("Creating installer script...")
@@ -4,8 +4,18 @@ Setup Script - Packaging for Code of Pride.
 This module creates distributable packages for the game.
 """
 
-from setuptools import setup, find_packages
-import os
+from setuptools import setup
+
+# Game packages, listed explicitly rather than discovered by scanning the tree
+SETUP_PACKAGES = (
+    'audio',
+    'core',
+    'entities',
+    'gameplay',
+    'scenes',
+    'story',
+    'ui',
+)
 
 # Read the README file for the long description
 def read_readme():
@@ -13,23 +23,6 @@ def read_readme():
     with open("README.md", "r", encoding="utf-8") as fh:
         return fh.read()
 
-# Get the list of package data files
-def get_package_data():
-    """Get package data files."""
-    package_data = []
-    
-    # Add assets
-    for root, dirs, files in os.walk("assets"):
-        for file in files:
-            package_data.append(os.path.join(root, file))
-            
-    # Add docs
-    for root, dirs, files in os.walk("docs"):
-        for file in files:
-            package_data.append(os.path.join(root, file))
-            
-    return package_data
-
 setup(
     name="code-of-pride",
     version="1.0.0",
@@ -39,11 +32,15 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/code-of-pride",
-    packages=find_packages(),
+    packages=list(SETUP_PACKAGES),
+    py_modules=["config"],
+    # Data files are matched by setuptools at build time (MANIFEST.in adds
+    # them to the sdist) instead of being listed by walking the tree here
     package_data={
-        '': get_package_data()
+        '': ['assets/**/*', 'docs/**/*']
     },
     include_package_data=True,
+    zip_safe=False,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",
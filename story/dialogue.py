@@ -6,178 +6,353 @@ and narrative voice-overs.
 """
 
 import pygame
-import random
-from typing import List, Dict, Optional
+from random import choice as _choice
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
+
+
+# Dialogue box colors
+_COLOR_BACKGROUND = (30, 30, 40, 220)  # Semi-transparent
+_COLOR_BORDER = (46, 94, 170)  # Blue
+_COLOR_TEXT = (240, 240, 240)
+_COLOR_NAME = (255, 184, 28)  # Gold
+_COLOR_PROGRESS = (150, 150, 150)
+_COLOR_PROMPT = (200, 200, 200)
+
+# Voice traits and dialogue lines of each character, shared by every
+# dialogue system
+CHARACTERS = MappingProxyType({
+    'drum_major': {
+        'name': 'Drum Major Maya',
+        'voice_traits': {
+            'tone': 'confident',
+            'pace': 'moderate',
+            'style': 'encouraging'
+        },
+        'dialogue_variants': {
+            'encouragement': (
+                "Great job! You're getting the hang of this!",
+                "That's exactly right! Keep up the excellent work!",
+                "I can see you're putting in real effort. Well done!",
+                "Perfect formation! You're a natural at this!"
+            ),
+            'hints': (
+                "Remember to check your syntax carefully.",
+                "Try breaking the problem into smaller steps.",
+                "Think about how you can use loops to simplify your code.",
+                "Don't forget to test your code before running it!"
+            ),
+            'challenge': (
+                "This next drill is going to be tricky, but I know you can handle it!",
+                "Let's see what you've learned with this more complex challenge.",
+                "Time to put your skills to the test with a real challenge!",
+                "This formation requires precision. Take your time and think it through."
+            )
+        }
+    },
+    'band_director': {
+        'name': 'Mr. Rodriguez',
+        'voice_traits': {
+            'tone': 'authoritative',
+            'pace': 'slow',
+            'style': 'instructional'
+        },
+        'dialogue_variants': {
+            'briefing': (
+                "Welcome to today's rehearsal. Here's what we need to accomplish.",
+                "Today's challenge will test everything you've learned so far.",
+                "This week's performance is critical. Let's make it count.",
+                "I've designed this drill to push your programming skills to the limit."
+            ),
+            'feedback': (
+                "Precision is everything in both music and code.",
+                "Every line of code is like a note in our performance.",
+                "Attention to detail separates good programmers from great ones.",
+                "Your code should be as clean and precise as our marching formations."
+            ),
+            'conclusion': (
+                "Excellent work today. This is exactly the quality I expect.",
+                "That performance was outstanding. You're ready for the competition.",
+                "Perfect execution! This is what I like to see.",
+                "You've mastered today's lesson. Well done, everyone."
+            )
+        }
+    },
+    'brass_leader': {
+        'name': 'Brass Section Leader',
+        'voice_traits': {
+            'tone': 'enthusiastic',
+            'pace': 'fast',
+            'style': 'supportive'
+        },
+        'dialogue_variants': {
+            'greeting': (
+                "Hey there! Ready to brass it up?",
+                "Let's make some noise with our code!",
+                "Brass players unite! Let's code some formations!",
+                "Time to show them what brass can do!"
+            ),
+            'tips': (
+                "Brass players always hit the right note - just like your code should!",
+                "In brass, we blow our horns loud - make your code stand out!",
+                "Every brass player knows timing is key - just like in programming!",
+                "Brass sections work as a team - just like your code functions!"
+            )
+        }
+    },
+    'woodwind_leader': {
+        'name': 'Woodwind Section Leader',
+        'voice_traits': {
+            'tone': 'gentle',
+            'pace': 'moderate',
+            'style': 'thoughtful'
+        },
+        'dialogue_variants': {
+            'greeting': (
+                "Hello! Let's create something beautiful together.",
+                "Woodwinds bring harmony to music, just like clean code brings harmony to programs.",
+                "Let's approach this challenge with precision and grace.",
+                "Ready to weave some elegant code patterns?"
+            ),
+            'tips': (
+                "Like a woodwind instrument, your code should flow smoothly.",
+                "Woodwinds require careful breath control - your code needs careful logic control.",
+                "Each woodwind has its unique voice - each function should have a unique purpose.",
+                "Harmony in music comes from each instrument playing its part - harmony in code comes from each function doing its job."
+            )
+        }
+    },
+    'percussion_leader': {
+        'name': 'Percussion Section Leader',
+        'voice_traits': {
+            'tone': 'energetic',
+            'pace': 'fast',
+            'style': 'rhythmic'
+        },
+        'dialogue_variants': {
+            'greeting': (
+                "Let's beat this challenge into submission!",
+                "Time to drum up some awesome code!",
+                "Percussion power! Let's code with rhythm!",
+                "Get ready to rock... I mean, code!"
+            ),
+            'tips': (
+                "In percussion, timing is everything - in programming, logic is everything!",
+                "Every beat counts in percussion - every line counts in code!",
+                "Percussion keeps the rhythm - your code should keep the logical flow!",
+                "We hit hard in percussion - make your code hit hard with efficiency!"
+            )
+        }
+    },
+    'guard_leader': {
+        'name': 'Color Guard Leader',
+        'voice_traits': {
+            'tone': 'graceful',
+            'pace': 'moderate',
+            'style': 'artistic'
+        },
+        'dialogue_variants': {
+            'greeting': (
+                "Let's paint the field with beautiful code!",
+                "Time to add some flair to our programming!",
+                "Color Guard style - let's make our code visually stunning!",
+                "Ready to choreograph some elegant algorithms?"
+            ),
+            'tips': (
+                "Like a flag routine, your code should be graceful and purposeful.",
+                "Every spin in color guard has meaning - every function in your code should have purpose.",
+                "We create visual art with our movements - you can create logical art with your code.",
+                "Precision in our spins leads to beauty - precision in your code leads to functionality."
+            )
+        }
+    }
+})
+
+# Display name of each character
+CHARACTER_NAMES = MappingProxyType({key: char_data['name'] for key, char_data in CHARACTERS.items()})
+
+# Every line of each character, picked from when a dialogue type is missing
+_ALL_DIALOGUE = MappingProxyType({
+    key: tuple(line for lines in char_data['dialogue_variants'].values() for line in lines)
+    for key, char_data in CHARACTERS.items()
+})
+
+# Opening lines of each story beat, and the lines of any other beat
+STORY_BEAT_DIALOGUE = {
+    'preseason': (
+        "Welcome to the Pride of Casa Grande marching band!",
+        "I'm Drum Major Maya, and I'll be helping you learn our drill system.",
+        "This season, you'll be our new Drill Writer, programming our formations with Python.",
+        "Let's start with something simple to get you familiar with the system.",
+        "Use the code editor on the left to move band members around the field."
+    ),
+    'first_game': (
+        "Great work during practice! Our first game is this Friday.",
+        "Mr. Rodriguez has designed a special routine for our debut performance.",
+        "This formation requires precise timing - just like your code needs precise logic.",
+        "Remember, in both programming and marching band, attention to detail is crucial.",
+        "Let's show the crowd what the Pride of Casa Grande can do!"
+    ),
+    'rivalry': (
+        "This week's game is against our biggest rivals, Desert Ridge.",
+        "The pressure is on, but I know we can rise to the challenge.",
+        "This formation is more complex than anything we've done before.",
+        "You'll need to use everything you've learned about loops and functions.",
+        "Let's show them what Casa Grande pride really means!"
+    ),
+    'homecoming': (
+        "Homecoming week is always special. The whole school will be watching.",
+        "We've been working on something really special for this performance.",
+        "This routine combines all the Python concepts you've learned so far.",
+        "It's going to take careful planning and precise execution.",
+        "I have complete confidence in your abilities as our Drill Writer."
+    ),
+    'midseason': (
+        "We're halfway through the season, and you're doing an amazing job!",
+        "The regionals are coming up, so we need to step up our game.",
+        "This week's challenge will test your understanding of data structures.",
+        "You'll be organizing our sections using lists and dictionaries.",
+        "Remember, a good programmer is like a good section leader - organized and efficient."
+    ),
+    'playoffs': (
+        "We made it to the playoffs! This is what we've been working toward.",
+        "The competition will be fierce, but our programming skills give us an edge.",
+        "This performance requires advanced techniques - functions and modules.",
+        "You've come a long way since preseason. I'm proud of your progress.",
+        "Let's show them the power of Python and the Pride of Casa Grande!"
+    ),
+    'championship': (
+        "This is it - the championship game! We've worked so hard to get here.",
+        "This final performance needs to be absolutely perfect.",
+        "You'll be using all your Python skills - from basics to object-oriented programming.",
+        "Every band member is counting on us to give them the best show possible.",
+        "This is your moment to shine. Make the Pride of Casa Grande proud!"
+    ),
+}
+
+DEFAULT_STORY_BEAT_DIALOGUE = (
+    "Another great week of practice!",
+    "You're becoming a skilled Drill Writer.",
+    "Keep up the excellent work!",
+    "Let's continue building on what we've learned."
+)
+
+# Lines each character introduces themselves with, and those of anyone else
+CHARACTER_INTRODUCTIONS = {
+    'drum_major': (
+        "Hi there! I'm Drum Major Maya, your guide through this marching band adventure.",
+        "I'll be helping you learn how to program our formations using Python.",
+        "Don't worry if it seems tricky at first - we all start somewhere!",
+        "Remember, every expert was once a beginner. You've got this!"
+    ),
+    'band_director': (
+        "Good day. I'm Mr. Rodriguez, director of the Pride of Casa Grande.",
+        "As your band director, I'm responsible for our show's artistic vision.",
+        "I'll be assigning you challenges that push your programming abilities.",
+        "Precision and dedication - these qualities make both great musicians and great programmers."
+    ),
+    'brass_leader': (
+        "Hey! I'm the Brass Section Leader, ready to add some power to our code!",
+        "Brass instruments are loud and proud - just like your code should be clear and confident!",
+        "We'll be working on formations that really showcase our section.",
+        "Let's make some noise with our programming skills!"
+    ),
+    'woodwind_leader': (
+        "Hello, I'm the Woodwind Section Leader.",
+        "Woodwinds add harmony and beauty to our music, just as clean code adds elegance to programs.",
+        "I'll help you create precise and graceful code solutions.",
+        "Let's approach each challenge with thoughtfulness and attention to detail."
+    ),
+    'percussion_leader': (
+        "Rock on! I'm the Percussion Section Leader, bringing the beat to our code!",
+        "In percussion, timing is everything - in programming, logic is everything!",
+        "We'll be creating routines with rhythm and precision.",
+        "Get ready to drum up some amazing code with me!"
+    ),
+    'guard_leader': (
+        "Greetings! I'm the Color Guard Leader, here to add visual flair to our programming!",
+        "Just as we create beautiful visual performances, you'll be creating elegant code solutions.",
+        "I'll help you make your code as graceful and purposeful as our flag routines.",
+        "Let's paint the field of programming with beautiful, functional code!"
+    ),
+}
+
+DEFAULT_CHARACTER_INTRODUCTION = (
+    "Hello! I'm excited to work with you this season.",
+    "Together, we'll create amazing formations using Python.",
+    "Let's make this season unforgettable!"
+)
+
+# System fonts keyed by (name, size, bold), shared by every dialogue system
+_fonts = {}
+
+
+def _get_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Return a system font, loading it on first use."""
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+class ActiveDialogue:
+    """State of the dialogue sequence being shown."""
+    
+    __slots__ = ('character', 'name', 'sequence', 'current_index', 'rendered', 'name_surf', 'progress_surfs',
+                 'view')
+    
+    def __init__(self, character: str, name: str, sequence: Tuple[str, ...]):
+        self.character = character
+        self.name = name
+        self.sequence = sequence
+        self.current_index = 0
+        # Rendered speaker name and "1/N" to "N/N" progress indicators,
+        # rendered on first draw
+        self.name_surf: Optional[pygame.Surface] = None
+        self.progress_surfs: Optional[Tuple[pygame.Surface, ...]] = None
+        # Rendered rows of each line keyed by (index, box width)
+        self.rendered: Dict[Tuple[int, int], List[pygame.Surface]] = {}
+        # Information returned by DialogueSystem.get_current_dialogue
+        self.view: Optional[Dict] = None
 
 
 class DialogueSystem:
     """Manages character dialogue and narrative voice-overs."""
     
+    __slots__ = ('characters', 'character_names', 'all_dialogue', 'current_dialogue', 'dialogue_complete',
+                 'font', 'name_font', 'colors', 'box_backgrounds', 'prompt_surf')
+    
     def __init__(self):
-        self.characters = {
-            'drum_major': {
-                'name': 'Drum Major Maya',
-                'voice_traits': {
-                    'tone': 'confident',
-                    'pace': 'moderate',
-                    'style': 'encouraging'
-                },
-                'dialogue_variants': {
-                    'encouragement': [
-                        "Great job! You're getting the hang of this!",
-                        "That's exactly right! Keep up the excellent work!",
-                        "I can see you're putting in real effort. Well done!",
-                        "Perfect formation! You're a natural at this!"
-                    ],
-                    'hints': [
-                        "Remember to check your syntax carefully.",
-                        "Try breaking the problem into smaller steps.",
-                        "Think about how you can use loops to simplify your code.",
-                        "Don't forget to test your code before running it!"
-                    ],
-                    'challenge': [
-                        "This next drill is going to be tricky, but I know you can handle it!",
-                        "Let's see what you've learned with this more complex challenge.",
-                        "Time to put your skills to the test with a real challenge!",
-                        "This formation requires precision. Take your time and think it through."
-                    ]
-                }
-            },
-            'band_director': {
-                'name': 'Mr. Rodriguez',
-                'voice_traits': {
-                    'tone': 'authoritative',
-                    'pace': 'slow',
-                    'style': 'instructional'
-                },
-                'dialogue_variants': {
-                    'briefing': [
-                        "Welcome to today's rehearsal. Here's what we need to accomplish.",
-                        "Today's challenge will test everything you've learned so far.",
-                        "This week's performance is critical. Let's make it count.",
-                        "I've designed this drill to push your programming skills to the limit."
-                    ],
-                    'feedback': [
-                        "Precision is everything in both music and code.",
-                        "Every line of code is like a note in our performance.",
-                        "Attention to detail separates good programmers from great ones.",
-                        "Your code should be as clean and precise as our marching formations."
-                    ],
-                    'conclusion': [
-                        "Excellent work today. This is exactly the quality I expect.",
-                        "That performance was outstanding. You're ready for the competition.",
-                        "Perfect execution! This is what I like to see.",
-                        "You've mastered today's lesson. Well done, everyone."
-                    ]
-                }
-            },
-            'brass_leader': {
-                'name': 'Brass Section Leader',
-                'voice_traits': {
-                    'tone': 'enthusiastic',
-                    'pace': 'fast',
-                    'style': 'supportive'
-                },
-                'dialogue_variants': {
-                    'greeting': [
-                        "Hey there! Ready to brass it up?",
-                        "Let's make some noise with our code!",
-                        "Brass players unite! Let's code some formations!",
-                        "Time to show them what brass can do!"
-                    ],
-                    'tips': [
-                        "Brass players always hit the right note - just like your code should!",
-                        "In brass, we blow our horns loud - make your code stand out!",
-                        "Every brass player knows timing is key - just like in programming!",
-                        "Brass sections work as a team - just like your code functions!"
-                    ]
-                }
-            },
-            'woodwind_leader': {
-                'name': 'Woodwind Section Leader',
-                'voice_traits': {
-                    'tone': 'gentle',
-                    'pace': 'moderate',
-                    'style': 'thoughtful'
-                },
-                'dialogue_variants': {
-                    'greeting': [
-                        "Hello! Let's create something beautiful together.",
-                        "Woodwinds bring harmony to music, just like clean code brings harmony to programs.",
-                        "Let's approach this challenge with precision and grace.",
-                        "Ready to weave some elegant code patterns?"
-                    ],
-                    'tips': [
-                        "Like a woodwind instrument, your code should flow smoothly.",
-                        "Woodwinds require careful breath control - your code needs careful logic control.",
-                        "Each woodwind has its unique voice - each function should have a unique purpose.",
-                        "Harmony in music comes from each instrument playing its part - harmony in code comes from each function doing its job."
-                    ]
-                }
-            },
-            'percussion_leader': {
-                'name': 'Percussion Section Leader',
-                'voice_traits': {
-                    'tone': 'energetic',
-                    'pace': 'fast',
-                    'style': 'rhythmic'
-                },
-                'dialogue_variants': {
-                    'greeting': [
-                        "Let's beat this challenge into submission!",
-                        "Time to drum up some awesome code!",
-                        "Percussion power! Let's code with rhythm!",
-                        "Get ready to rock... I mean, code!"
-                    ],
-                    'tips': [
-                        "In percussion, timing is everything - in programming, logic is everything!",
-                        "Every beat counts in percussion - every line counts in code!",
-                        "Percussion keeps the rhythm - your code should keep the logical flow!",
-                        "We hit hard in percussion - make your code hit hard with efficiency!"
-                    ]
-                }
-            },
-            'guard_leader': {
-                'name': 'Color Guard Leader',
-                'voice_traits': {
-                    'tone': 'graceful',
-                    'pace': 'moderate',
-                    'style': 'artistic'
-                },
-                'dialogue_variants': {
-                    'greeting': [
-                        "Let's paint the field with beautiful code!",
-                        "Time to add some flair to our programming!",
-                        "Color Guard style - let's make our code visually stunning!",
-                        "Ready to choreograph some elegant algorithms?"
-                    ],
-                    'tips': [
-                        "Like a flag routine, your code should be graceful and purposeful.",
-                        "Every spin in color guard has meaning - every function in your code should have purpose.",
-                        "We create visual art with our movements - you can create logical art with your code.",
-                        "Precision in our spins leads to beauty - precision in your code leads to functionality."
-                    ]
-                }
-            }
-        }
+        # Character data, shared by every dialogue system
+        self.characters = CHARACTERS
+        self.character_names = CHARACTER_NAMES
+        self.all_dialogue = _ALL_DIALOGUE
         
-        # Current dialogue state
-        self.current_dialogue = None
-        self.dialogue_index = 0
+        # Current dialogue state (dialogue_complete is read directly by the
+        # story engine)
+        self.current_dialogue: Optional[ActiveDialogue] = None
         self.dialogue_complete = False
         
-        # Font setup
-        self.font = pygame.font.SysFont('arial', 16)
-        self.name_font = pygame.font.SysFont('arial', 18, bold=True)
+        # Fonts, loaded on first use so dialogue logic works without pygame.font
+        self.font: Optional[pygame.font.Font] = None
+        self.name_font: Optional[pygame.font.Font] = None
         
         # Colors
         self.colors = {
-            'background': (30, 30, 40, 220),  # Semi-transparent
-            'border': (46, 94, 170),  # Blue
-            'text': (240, 240, 240),
-            'name': (255, 184, 28)  # Gold
+            'background': _COLOR_BACKGROUND,
+            'border': _COLOR_BORDER,
+            'text': _COLOR_TEXT,
+            'name': _COLOR_NAME
         }
         
+        # Filled dialogue box backgrounds keyed by (width, height)
+        self.box_backgrounds = {}
+        
+        # Continue prompt shown under every line, rendered with the fonts
+        self.prompt_surf: Optional[pygame.Surface] = None
+        
     def get_character_dialogue(self, character: str, dialogue_type: str) -> str:
         """Get a random dialogue line for a character.
         
@@ -188,39 +363,43 @@ class DialogueSystem:
         Returns:
             Dialogue line
         """
-        if character not in self.characters:
+        char_data = self.characters.get(character)
+        if char_data is None:
             return "..."
             
-        char_data = self.characters[character]
-        if dialogue_type not in char_data['dialogue_variants']:
+        lines = char_data['dialogue_variants'].get(dialogue_type)
+        if lines is None:
             # Return any dialogue if specific type not found
-            all_dialogue = []
-            for lines in char_data['dialogue_variants'].values():
-                all_dialogue.extend(lines)
-            return random.choice(all_dialogue) if all_dialogue else "..."
+            lines = self.all_dialogue[character]
             
-        return random.choice(char_data['dialogue_variants'][dialogue_type])
+        return _choice(lines) if lines else "..."
         
-    def start_dialogue_sequence(self, character: str, dialogue_sequence: List[str]):
+    def start_dialogue_sequence(self, character: str, dialogue_sequence: List[str],
+                                box_width: Optional[int] = None):
         """Start a sequence of dialogue lines.
         
         Args:
             character: Character speaking
             dialogue_sequence: List of dialogue lines
+            box_width: Width of the dialogue box the lines will be drawn in,
+                to wrap and render them up front
         """
         if not dialogue_sequence:
             self.current_dialogue = None
             self.dialogue_complete = True
             return
             
-        self.current_dialogue = {
-            'character': character,
-            'name': self.characters.get(character, {}).get('name', character),
-            'sequence': dialogue_sequence,
-            'current_index': 0
-        }
+        self.current_dialogue = ActiveDialogue(character, self.character_names.get(character, character),
+                                               tuple(dialogue_sequence))
+        self._update_dialogue_view()
         self.dialogue_complete = False
         
+        if box_width is not None:
+            self._ensure_fonts()
+            self._render_captions()
+            for index in range(len(dialogue_sequence)):
+                self._get_line_rows(index, box_width)
+        
     def advance_dialogue(self) -> bool:
         """Advance to the next line in the dialogue sequence.
         
@@ -231,30 +410,41 @@ class DialogueSystem:
             self.dialogue_complete = True
             return False
             
-        self.current_dialogue['current_index'] += 1
+        self.current_dialogue.current_index += 1
         
-        if self.current_dialogue['current_index'] >= len(self.current_dialogue['sequence']):
+        if self.current_dialogue.current_index >= len(self.current_dialogue.sequence):
             self.current_dialogue = None
             self.dialogue_complete = True
             return False
             
+        self._update_dialogue_view()
         return True
         
     def get_current_dialogue(self) -> Optional[Dict]:
         """Get the current dialogue information.
         
+        The dictionary is shared until the dialogue advances, so callers
+        must not modify it.
+        
         Returns:
             Dictionary with current dialogue information or None
         """
         if not self.current_dialogue:
             return None
             
-        return {
-            'character': self.current_dialogue['character'],
-            'name': self.current_dialogue['name'],
-            'line': self.current_dialogue['sequence'][self.current_dialogue['current_index']],
-            'index': self.current_dialogue['current_index'],
-            'total': len(self.current_dialogue['sequence'])
+        return self.current_dialogue.view
+        
+    def _update_dialogue_view(self):
+        """Build the information returned by get_current_dialogue for the
+        current line."""
+        dialogue = self.current_dialogue
+        index = dialogue.current_index
+        dialogue.view = {
+            'character': dialogue.character,
+            'name': dialogue.name,
+            'line': dialogue.sequence[index],
+            'index': index,
+            'total': len(dialogue.sequence)
         }
         
     def is_dialogue_complete(self) -> bool:
@@ -273,38 +463,94 @@ class DialogueSystem:
             x, y: Position of the dialogue box
             width, height: Dimensions of the dialogue box
         """
-        if not self.current_dialogue:
+        # Nothing to draw without dialogue or when the box is clipped away
+        if self.current_dialogue is None or not surface.get_clip().colliderect((x, y, width, height)):
             return
+        self._ensure_fonts()
             
         # Draw background
-        bg_rect = pygame.Rect(x, y, width, height)
-        s = pygame.Surface((width, height), pygame.SRCALPHA)
-        s.fill(self.colors['background'])
-        surface.blit(s, (x, y))
-        pygame.draw.rect(surface, self.colors['border'], bg_rect, 2)
+        surface.blit(self._get_box_background(width, height), (x, y))
+        pygame.draw.rect(surface, _COLOR_BORDER, (x, y, width, height), 2)
         
         # Get current dialogue
         dialogue = self.get_current_dialogue()
         if not dialogue:
             return
             
+        # Render the name and progress indicators of a new sequence
+        if self.current_dialogue.name_surf is None:
+            self._render_captions()
+            
         # Draw character name
-        name_surf = self.name_font.render(dialogue['name'], True, self.colors['name'])
-        surface.blit(name_surf, (x + 10, y + 10))
+        surface.blit(self.current_dialogue.name_surf, (x + 10, y + 10))
         
-        # Draw dialogue line
-        line_surf = self.font.render(dialogue['line'], True, self.colors['text'])
-        surface.blit(line_surf, (x + 10, y + 40))
+        # Draw dialogue line, wrapped to the box and limited to the rows that
+        # fit above the progress indicator and prompt
+        line_height = self.font.get_linesize()
+        max_rows = max(1, (height - 65) // line_height)
+        rows = self._get_line_rows(dialogue['index'], width)[:max_rows]
+        surface.blits([(row_surf, (x + 10, y + 40 + row * line_height)) for row, row_surf in enumerate(rows)],
+                      doreturn=False)
         
         # Draw progress indicator
-        progress = f"{dialogue['index'] + 1}/{dialogue['total']}"
-        progress_surf = self.font.render(progress, True, (150, 150, 150))
+        progress_surf = self.current_dialogue.progress_surfs[dialogue['index']]
         surface.blit(progress_surf, (x + width - 50, y + height - 25))
         
         # Draw continue prompt
-        prompt = "Press SPACE to continue..."
-        prompt_surf = self.font.render(prompt, True, (200, 200, 200))
-        surface.blit(prompt_surf, (x + 10, y + height - 25))
+        surface.blit(self.prompt_surf, (x + 10, y + height - 25))
+        
+    def _ensure_fonts(self):
+        """Load the fonts and render the continue prompt on first use."""
+        if self.font is None:
+            self.font = _get_font('arial', 16)
+            self.name_font = _get_font('arial', 18, bold=True)
+            self.prompt_surf = self.font.render("Press SPACE to continue...", True, _COLOR_PROMPT)
+            
+    def _render_captions(self):
+        """Render the speaker name and progress indicators of the current
+        sequence."""
+        dialogue = self.current_dialogue
+        dialogue.name_surf = self.name_font.render(dialogue.name, True, _COLOR_NAME)
+        total = len(dialogue.sequence)
+        dialogue.progress_surfs = tuple(
+            self.font.render(f"{i + 1}/{total}", True, _COLOR_PROGRESS) for i in range(total))
+        
+    def _get_line_rows(self, index: int, box_width: int) -> List[pygame.Surface]:
+        """Return the rendered rows of a line of the current sequence wrapped
+        to a dialogue box width, wrapping and rendering it on first use."""
+        key = (index, box_width)
+        rows = self.current_dialogue.rendered.get(key)
+        if rows is None:
+            text = self.current_dialogue.sequence[index]
+            rows = [self.font.render(row, True, _COLOR_TEXT)
+                    for row in self._wrap_text(text, box_width - 20)]
+            self.current_dialogue.rendered[key] = rows
+        return rows
+        
+    def _wrap_text(self, text: str, max_width: int) -> List[str]:
+        """Split text into rows no wider than max_width where possible."""
+        rows = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}" if current else word
+            if current and self.font.size(candidate)[0] > max_width:
+                rows.append(current)
+                current = word
+            else:
+                current = candidate
+        if current:
+            rows.append(current)
+        return rows
+        
+    def _get_box_background(self, width: int, height: int) -> pygame.Surface:
+        """Return the semi-transparent background of a dialogue box, filled
+        once per size."""
+        background = self.box_backgrounds.get((width, height))
+        if background is None:
+            background = pygame.Surface((width, height), pygame.SRCALPHA)
+            background.fill(_COLOR_BACKGROUND)
+            self.box_backgrounds[(width, height)] = background
+        return background
         
     def get_story_beat_dialogue(self, story_beat: str, week: int) -> List[str]:
         """Get dialogue for a specific story beat.
@@ -316,64 +562,7 @@ class DialogueSystem:
         Returns:
             List of dialogue lines
         """
-        dialogue_map = {
-            'preseason': [
-                "Welcome to the Pride of Casa Grande marching band!",
-                "I'm Drum Major Maya, and I'll be helping you learn our drill system.",
-                "This season, you'll be our new Drill Writer, programming our formations with Python.",
-                "Let's start with something simple to get you familiar with the system.",
-                "Use the code editor on the left to move band members around the field."
-            ],
-            'first_game': [
-                "Great work during practice! Our first game is this Friday.",
-                "Mr. Rodriguez has designed a special routine for our debut performance.",
-                "This formation requires precise timing - just like your code needs precise logic.",
-                "Remember, in both programming and marching band, attention to detail is crucial.",
-                "Let's show the crowd what the Pride of Casa Grande can do!"
-            ],
-            'rivalry': [
-                "This week's game is against our biggest rivals, Desert Ridge.",
-                "The pressure is on, but I know we can rise to the challenge.",
-                "This formation is more complex than anything we've done before.",
-                "You'll need to use everything you've learned about loops and functions.",
-                "Let's show them what Casa Grande pride really means!"
-            ],
-            'homecoming': [
-                "Homecoming week is always special. The whole school will be watching.",
-                "We've been working on something really special for this performance.",
-                "This routine combines all the Python concepts you've learned so far.",
-                "It's going to take careful planning and precise execution.",
-                "I have complete confidence in your abilities as our Drill Writer."
-            ],
-            'midseason': [
-                "We're halfway through the season, and you're doing an amazing job!",
-                "The regionals are coming up, so we need to step up our game.",
-                "This week's challenge will test your understanding of data structures.",
-                "You'll be organizing our sections using lists and dictionaries.",
-                "Remember, a good programmer is like a good section leader - organized and efficient."
-            ],
-            'playoffs': [
-                "We made it to the playoffs! This is what we've been working toward.",
-                "The competition will be fierce, but our programming skills give us an edge.",
-                "This performance requires advanced techniques - functions and modules.",
-                "You've come a long way since preseason. I'm proud of your progress.",
-                "Let's show them the power of Python and the Pride of Casa Grande!"
-            ],
-            'championship': [
-                "This is it - the championship game! We've worked so hard to get here.",
-                "This final performance needs to be absolutely perfect.",
-                "You'll be using all your Python skills - from basics to object-oriented programming.",
-                "Every band member is counting on us to give them the best show possible.",
-                "This is your moment to shine. Make the Pride of Casa Grande proud!"
-            ]
-        }
-        
-        return dialogue_map.get(story_beat, [
-            "Another great week of practice!",
-            "You're becoming a skilled Drill Writer.",
-            "Keep up the excellent work!",
-            "Let's continue building on what we've learned."
-        ])
+        return list(STORY_BEAT_DIALOGUE.get(story_beat, DEFAULT_STORY_BEAT_DIALOGUE))
         
     def get_character_introduction(self, character: str) -> List[str]:
         """Get introduction dialogue for a character.
@@ -384,47 +573,4 @@ class DialogueSystem:
         Returns:
             List of introduction dialogue lines
         """
-        introductions = {
-            'drum_major': [
-                "Hi there! I'm Drum Major Maya, your guide through this marching band adventure.",
-                "I'll be helping you learn how to program our formations using Python.",
-                "Don't worry if it seems tricky at first - we all start somewhere!",
-                "Remember, every expert was once a beginner. You've got this!"
-            ],
-            'band_director': [
-                "Good day. I'm Mr. Rodriguez, director of the Pride of Casa Grande.",
-                "As your band director, I'm responsible for our show's artistic vision.",
-                "I'll be assigning you challenges that push your programming abilities.",
-                "Precision and dedication - these qualities make both great musicians and great programmers."
-            ],
-            'brass_leader': [
-                "Hey! I'm the Brass Section Leader, ready to add some power to our code!",
-                "Brass instruments are loud and proud - just like your code should be clear and confident!",
-                "We'll be working on formations that really showcase our section.",
-                "Let's make some noise with our programming skills!"
-            ],
-            'woodwind_leader': [
-                "Hello, I'm the Woodwind Section Leader.",
-                "Woodwinds add harmony and beauty to our music, just as clean code adds elegance to programs.",
-                "I'll help you create precise and graceful code solutions.",
-                "Let's approach each challenge with thoughtfulness and attention to detail."
-            ],
-            'percussion_leader': [
-                "Rock on! I'm the Percussion Section Leader, bringing the beat to our code!",
-                "In percussion, timing is everything - in programming, logic is everything!",
-                "We'll be creating routines with rhythm and precision.",
-                "Get ready to drum up some amazing code with me!"
-            ],
-            'guard_leader': [
-                "Greetings! I'm the Color Guard Leader, here to add visual flair to our programming!",
-                "Just as we create beautiful visual performances, you'll be creating elegant code solutions.",
-                "I'll help you make your code as graceful and purposeful as our flag routines.",
-                "Let's paint the field of programming with beautiful, functional code!"
-            ]
-        }
-        
-        return introductions.get(character, [
-            "Hello! I'm excited to work with you this season.",
-            "Together, we'll create amazing formations using Python.",
-            "Let's make this season unforgettable!"
-        ])
\ No newline at end of file
+        return list(CHARACTER_INTRODUCTIONS.get(character, DEFAULT_CHARACTER_INTRODUCTION))
\ No newline at end of file
@@ -6,10 +6,109 @@ progression of the campaign mode.
 """
 
 import pygame
-from typing import List, Dict, Optional
+from array import array
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
 from story.dialogue import DialogueSystem
 
 
+# Narrative content of each story beat
+STORY_BEATS = MappingProxyType({
+    'preseason': {
+        'title': 'Preseason Practice',
+        'description': 'Getting ready for the season ahead',
+        'key_events': (
+            'Introduction to the Pride of Casa Grande',
+            'Meeting the team and staff',
+            'Learning the basics of drill programming'
+        ),
+        'characters': ('drum_major', 'band_director'),
+        'themes': ('introduction', 'learning', 'teamwork')
+    },
+    'first_game': {
+        'title': 'First Game',
+        'description': 'Debut performance at Casa Grande High',
+        'key_events': (
+            'Nervous energy before the performance',
+            'Executing the first drill successfully',
+            'Positive feedback from the crowd'
+        ),
+        'characters': ('drum_major', 'band_director'),
+        'themes': ('debut', 'performance', 'confidence')
+    },
+    'rivalry': {
+        'title': 'Rivalry Week',
+        'description': 'Showdown against Desert Ridge',
+        'key_events': (
+            'Intense practice sessions',
+            'Developing complex formations',
+            'Competitive spirit and determination'
+        ),
+        'characters': ('drum_major', 'brass_leader', 'percussion_leader'),
+        'themes': ('competition', 'challenge', 'growth')
+    },
+    'homecoming': {
+        'title': 'Homecoming Spectacular',
+        'description': 'Special performance for homecoming week',
+        'key_events': (
+            'Creating a special routine for homecoming',
+            'Involving the entire school community',
+            'Showcasing advanced programming techniques'
+        ),
+        'characters': ('drum_major', 'guard_leader', 'woodwind_leader'),
+        'themes': ('community', 'celebration', 'showcase')
+    },
+    'midseason': {
+        'title': 'Midseason Review',
+        'description': 'Halfway point of the season',
+        'key_events': (
+            'Reflecting on progress made so far',
+            'Addressing areas for improvement',
+            'Preparing for the challenging second half'
+        ),
+        'characters': ('band_director', 'drum_major'),
+        'themes': ('reflection', 'improvement', 'preparation')
+    },
+    'playoffs': {
+        'title': 'Playoff Push',
+        'description': 'Competing in regional playoffs',
+        'key_events': (
+            'Elevated level of competition',
+            'Implementing advanced programming concepts',
+            'Team unity under pressure'
+        ),
+        'characters': ('band_director', 'drum_major', 'section_leaders'),
+        'themes': ('competition', 'advanced_skills', 'teamwork')
+    },
+    'championship': {
+        'title': 'State Championship',
+        'description': 'Final performance of the season',
+        'key_events': (
+            'The culmination of the entire season',
+            'Using all learned skills for the final challenge',
+            'Celebration of achievements and growth'
+        ),
+        'characters': ('band_director', 'drum_major', 'entire_team'),
+        'themes': ('culmination', 'mastery', 'celebration')
+    }
+})
+
+
+def _render_narrative(beat_info: Dict) -> str:
+    """Build the narrative summary of a story beat."""
+    events = "".join(f"{i}. {event}\n" for i, event in enumerate(beat_info['key_events'], 1))
+    return (f"{beat_info['title']}\n\n"
+            f"{beat_info['description']}\n\n"
+            f"This week's key moments:\n{events}")
+
+
+# Identifiers of every story beat
+_VALID_BEATS = frozenset(STORY_BEATS)
+
+# Narrative summary of each story beat
+_NARRATIVES = MappingProxyType({beat: _render_narrative(beat_info) for beat, beat_info in STORY_BEATS.items()})
+
+
 class StoryEngine:
     """Manages the narrative progression of the game."""
     
@@ -17,88 +116,14 @@ class StoryEngine:
         self.dialogue_system = DialogueSystem()
         self.current_story_beat = 'preseason'
         self.current_week = 1
-        self.story_progress = []
-        
-        # Story beats with their narrative content
-        self.story_beats = {
-            'preseason': {
-                'title': 'Preseason Practice',
-                'description': 'Getting ready for the season ahead',
-                'key_events': [
-                    'Introduction to the Pride of Casa Grande',
-                    'Meeting the team and staff',
-                    'Learning the basics of drill programming'
-                ],
-                'characters': ['drum_major', 'band_director'],
-                'themes': ['introduction', 'learning', 'teamwork']
-            },
-            'first_game': {
-                'title': 'First Game',
-                'description': 'Debut performance at Casa Grande High',
-                'key_events': [
-                    'Nervous energy before the performance',
-                    'Executing the first drill successfully',
-                    'Positive feedback from the crowd'
-                ],
-                'characters': ['drum_major', 'band_director'],
-                'themes': ['debut', 'performance', 'confidence']
-            },
-            'rivalry': {
-                'title': 'Rivalry Week',
-                'description': 'Showdown against Desert Ridge',
-                'key_events': [
-                    'Intense practice sessions',
-                    'Developing complex formations',
-                    'Competitive spirit and determination'
-                ],
-                'characters': ['drum_major', 'brass_leader', 'percussion_leader'],
-                'themes': ['competition', 'challenge', 'growth']
-            },
-            'homecoming': {
-                'title': 'Homecoming Spectacular',
-                'description': 'Special performance for homecoming week',
-                'key_events': [
-                    'Creating a special routine for homecoming',
-                    'Involving the entire school community',
-                    'Showcasing advanced programming techniques'
-                ],
-                'characters': ['drum_major', 'guard_leader', 'woodwind_leader'],
-                'themes': ['community', 'celebration', 'showcase']
-            },
-            'midseason': {
-                'title': 'Midseason Review',
-                'description': 'Halfway point of the season',
-                'key_events': [
-                    'Reflecting on progress made so far',
-                    'Addressing areas for improvement',
-                    'Preparing for the challenging second half'
-                ],
-                'characters': ['band_director', 'drum_major'],
-                'themes': ['reflection', 'improvement', 'preparation']
-            },
-            'playoffs': {
-                'title': 'Playoff Push',
-                'description': 'Competing in regional playoffs',
-                'key_events': [
-                    'Elevated level of competition',
-                    'Implementing advanced programming concepts',
-                    'Team unity under pressure'
-                ],
-                'characters': ['band_director', 'drum_major', 'section_leaders'],
-                'themes': ['competition', 'advanced_skills', 'teamwork']
-            },
-            'championship': {
-                'title': 'State Championship',
-                'description': 'Final performance of the season',
-                'key_events': [
-                    'The culmination of the entire season',
-                    'Using all learned skills for the final challenge',
-                    'Celebration of achievements and growth'
-                ],
-                'characters': ['band_director', 'drum_major', 'entire_team'],
-                'themes': ['culmination', 'mastery', 'celebration']
-            }
-        }
+        
+        # Story progress history as parallel beat, week and timestamp columns
+        self.progress_beats: List[str] = []
+        self.progress_weeks = array('i')
+        self.progress_timestamps = array('q')
+        
+        # Story beats with their narrative content, shared by every engine
+        self.story_beats = STORY_BEATS
         
     def get_story_beat_info(self, story_beat: str) -> Optional[Dict]:
         """Get information about a specific story beat.
@@ -121,18 +146,7 @@ class StoryEngine:
         Returns:
             Narrative text for the story beat
         """
-        beat_info = self.story_beats.get(story_beat)
-        if not beat_info:
-            return "Another week of practice and progress..."
-            
-        # Create a narrative summary
-        narrative = f"{beat_info['title']}\n\n"
-        narrative += f"{beat_info['description']}\n\n"
-        narrative += "This week's key moments:\n"
-        for i, event in enumerate(beat_info['key_events'], 1):
-            narrative += f"{i}. {event}\n"
-            
-        return narrative
+        return _NARRATIVES.get(story_beat, "Another week of practice and progress...")
         
     def get_weekly_narrative(self, week: int, story_beat: str) -> List[str]:
         """Get the weekly narrative dialogue.
@@ -153,15 +167,20 @@ class StoryEngine:
             new_beat: New story beat identifier
             week: Current week number
         """
-        if new_beat in self.story_beats:
-            self.current_story_beat = new_beat
-            self.current_week = week
-            self.story_progress.append({
-                'beat': new_beat,
-                'week': week,
-                'timestamp': pygame.time.get_ticks()
-            })
+        if new_beat not in _VALID_BEATS:
+            return
             
+        self.current_story_beat = new_beat
+        self.current_week = week
+        
+        # Repeating the latest entry adds nothing to the history
+        if (self.progress_beats and self.progress_beats[-1] == new_beat
+                and self.progress_weeks[-1] == week):
+            return
+        self.progress_beats.append(new_beat)
+        self.progress_weeks.append(week)
+        self.progress_timestamps.append(pygame.time.get_ticks())
+        
     def get_character_introduction(self, character: str) -> List[str]:
         """Get introduction dialogue for a character.
         
@@ -216,7 +235,7 @@ class StoryEngine:
         Returns:
             True if dialogue is complete, False otherwise
         """
-        return self.dialogue_system.is_dialogue_complete()
+        return self.dialogue_system.dialogue_complete
         
     def draw_dialogue_box(self, surface: pygame.Surface, x: int, y: int, width: int, height: int):
         """Draw the current dialogue in a box.
@@ -234,32 +253,57 @@ class StoryEngine:
         Returns:
             List of story progress entries
         """
-        return self.story_progress.copy()
+        return [
+            {'beat': beat, 'week': week, 'timestamp': timestamp}
+            for beat, week, timestamp in zip(self.progress_beats, self.progress_weeks, self.progress_timestamps)
+        ]
+        
+    def get_progress_count(self) -> int:
+        """Get the number of story progress entries.
+        
+        Returns:
+            Number of entries in the story progress history
+        """
+        return len(self.progress_beats)
+        
+    def get_latest_progress(self) -> Optional[Dict]:
+        """Get the most recent story progress entry.
+        
+        Returns:
+            The latest story progress entry or None
+        """
+        if not self.progress_beats:
+            return None
+        return {
+            'beat': self.progress_beats[-1],
+            'week': self.progress_weeks[-1],
+            'timestamp': self.progress_timestamps[-1]
+        }
         
-    def get_available_characters(self, story_beat: str) -> List[str]:
+    def get_available_characters(self, story_beat: str) -> Tuple[str, ...]:
         """Get characters available for a story beat.
         
         Args:
             story_beat: Story beat identifier
             
         Returns:
-            List of available character names
+            Tuple of available character names
         """
         beat_info = self.story_beats.get(story_beat)
         if not beat_info:
-            return ['drum_major', 'band_director']
-        return beat_info.get('characters', ['drum_major', 'band_director'])
+            return ('drum_major', 'band_director')
+        return beat_info.get('characters', ('drum_major', 'band_director'))
         
-    def get_story_themes(self, story_beat: str) -> List[str]:
+    def get_story_themes(self, story_beat: str) -> Tuple[str, ...]:
         """Get themes for a story beat.
         
         Args:
             story_beat: Story beat identifier
             
         Returns:
-            List of theme keywords
+            Tuple of theme keywords
         """
         beat_info = self.story_beats.get(story_beat)
         if not beat_info:
-            return ['learning', 'progress']
-        return beat_info.get('themes', ['learning', 'progress'])
\ No newline at end of file
+            return ('learning', 'progress')
+        return beat_info.get('themes', ('learning', 'progress'))
\ No newline at end of file
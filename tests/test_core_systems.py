@@ -5,6 +5,7 @@ This module contains unit tests for the core systems of the game.
 """
 
 import unittest
+from unittest import mock
 import pygame
 import sys
 import os
@@ -21,6 +22,7 @@ from gameplay.lessons import LessonManager
 from gameplay.campaign import CampaignMode
 from gameplay.challenges import ChallengeMode
 from gameplay.sandbox import SandboxMode
+from story.dialogue import CHARACTERS
 from story.engine import StoryEngine
 
 
@@ -268,6 +270,33 @@ class TestStoryEngine(unittest.TestCase):
         dialogue = self.story_engine.get_character_dialogue('drum_major', 'encouragement')
         self.assertIsInstance(dialogue, str)
         self.assertGreater(len(dialogue), 0)
+        
+    def test_story_progress(self):
+        """Test that advancing the story records progress entries."""
+        self.story_engine.advance_story('rivalry', 3)
+        self.story_engine.advance_story('rivalry', 3)
+        self.story_engine.advance_story('unknown', 4)
+        progress = self.story_engine.get_story_progress()
+        self.assertEqual(len(progress), 1)
+        self.assertEqual(progress[0]['beat'], 'rivalry')
+        self.assertEqual(progress[0]['week'], 3)
+        self.assertEqual(self.story_engine.get_progress_count(), 1)
+        self.assertEqual(self.story_engine.get_latest_progress(), progress[0])
+        
+    def test_dialogue_sequence_without_fonts(self):
+        """Test that dialogue sequences run to completion without loading fonts."""
+        self.story_engine.start_dialogue_sequence('drum_major', ['First line', 'Second line'])
+        self.assertEqual(self.story_engine.get_current_dialogue()['line'], 'First line')
+        self.assertTrue(self.story_engine.advance_dialogue())
+        self.assertEqual(self.story_engine.get_current_dialogue()['index'], 1)
+        self.assertFalse(self.story_engine.advance_dialogue())
+        self.assertIsNone(self.story_engine.get_current_dialogue())
+        self.assertTrue(self.story_engine.is_dialogue_complete())
+        self.assertIsNone(self.story_engine.dialogue_system.font)
+        self.assertIsNone(self.story_engine.dialogue_system.name_font)
+        self.assertEqual(self.story_engine.get_character_dialogue('nobody', 'hints'), "...")
+        with mock.patch.dict(CHARACTERS['drum_major']['dialogue_variants'], {'silence': ()}):
+            self.assertEqual(self.story_engine.get_character_dialogue('drum_major', 'silence'), "...")
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ Section 5. Screen-Specific Visual Design
 
 import pygame
 import math
+from collections import OrderedDict
 from core.colors import (
     DARK_GRAPHITE_BLACK, RETRO_PIXEL_AMBER, DEEP_SIGNAL_BLUE,
     SILVER_STEEL, NEON_COMPETENCE_CYAN, GOLD_EXCELLENCE,
@@ -18,6 +19,17 @@ from core.colors import (
 )
 
 
+def display_format(surface, alpha=True):
+    """
+    Convert a cached surface to the display pixel format for fast blitting.
+    
+    Surfaces are returned unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
 class UIComponent:
     """Base class for all UI components."""
     
@@ -30,6 +42,11 @@ class UIComponent:
         """Draw the component on the given surface."""
         pass
     
+    def get_blits(self):
+        """Return (surface, position) pairs that draw the component, for
+        scenes that batch all their widgets into one blits call."""
+        return []
+    
     def handle_event(self, event):
         """Handle pygame events."""
         pass
@@ -59,44 +76,61 @@ class RetroButton(UIComponent):
         self.pressed_offset = 0
         self.glow_alpha = 0
         
+        # Button faces keyed by pressed state, and the rendered text
+        self.faces = {}
+        self.label = None
+        self.label_text = None
+        
     def set_click_callback(self, callback):
         """Set the function to call when button is clicked."""
         self.click_callback = callback
     
-    def draw(self, surface):
-        """Draw the button with appropriate styling based on state."""
+    def _get_face(self, pressed):
+        """Return the button body, border and highlight for a state."""
+        face = self.faces.get(pressed)
+        if face is None:
+            if pressed:
+                button_color = ColorPalette.adjust_brightness(DEEP_SIGNAL_BLUE, 0.9)
+            else:
+                button_color = DEEP_SIGNAL_BLUE
+            
+            face = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            face_rect = face.get_rect()
+            
+            # Draw main button
+            pygame.draw.rect(face, button_color, face_rect, border_radius=4)
+            
+            # Draw border
+            pygame.draw.rect(face, SILVER_STEEL, face_rect, 2, border_radius=4)
+            
+            # Draw inner highlight for normal/hover states
+            if not pressed:
+                highlight_rect = pygame.Rect(1, 1, face_rect.width - 2, 2)
+                pygame.draw.rect(face, RETRO_PIXEL_AMBER, highlight_rect)
+            
+            face = display_format(face)
+            self.faces[pressed] = face
+        return face
+    
+    def _get_label(self):
+        """Return the rendered button text, re-rendered when the text changes."""
+        if self.label_text != self.text:
+            self.label = self.font.render(self.text, True, SILVER_STEEL)
+            self.label_text = self.text
+        return self.label
+    
+    def get_blits(self):
+        """Return the (surface, position) pairs that draw the button."""
         if not self.visible:
-            return
+            return []
             
         # Calculate button position with pressed offset
-        draw_rect = self.rect.copy()
-        draw_rect.y += self.pressed_offset
-        
-        # Draw button background based on state
-        if self.state == "pressed":
-            button_color = ColorPalette.adjust_brightness(DEEP_SIGNAL_BLUE, 0.9)
-        elif self.state == "hover":
-            button_color = DEEP_SIGNAL_BLUE
-        else:
-            button_color = DEEP_SIGNAL_BLUE
-            
-        # Draw main button
-        pygame.draw.rect(surface, button_color, draw_rect, border_radius=4)
-        
-        # Draw border
-        pygame.draw.rect(surface, SILVER_STEEL, draw_rect, 2, border_radius=4)
+        draw_rect = self.rect.move(0, self.pressed_offset)
         
-        # Draw inner highlight for normal/hover states
-        if self.state != "pressed":
-            highlight_rect = pygame.Rect(
-                draw_rect.x + 1, 
-                draw_rect.y + 1, 
-                draw_rect.width - 2, 
-                2
-            )
-            pygame.draw.rect(surface, RETRO_PIXEL_AMBER, highlight_rect)
+        # Button body for the current state
+        blits = [(self._get_face(self.state == "pressed"), draw_rect)]
         
-        # Draw glow effect for hover state
+        # Glow effect for hover state
         if self.state == "hover" and self.glow_alpha > 0:
             glow_surf = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
             glow_color = pygame.Color(NEON_COMPETENCE_CYAN.r, NEON_COMPETENCE_CYAN.g, 
@@ -104,13 +138,17 @@ class RetroButton(UIComponent):
             pygame.draw.rect(glow_surf, glow_color, 
                            pygame.Rect(0, 0, draw_rect.width, draw_rect.height), 
                            border_radius=4)
-            surface.blit(glow_surf, draw_rect)
+            blits.append((glow_surf, draw_rect))
         
-        # Draw text
+        # Text
         if self.text:
-            text_surf = self.font.render(self.text, True, SILVER_STEEL)
-            text_rect = text_surf.get_rect(center=draw_rect.center)
-            surface.blit(text_surf, text_rect)
+            text_surf = self._get_label()
+            blits.append((text_surf, text_surf.get_rect(center=draw_rect.center)))
+        return blits
+    
+    def draw(self, surface):
+        """Draw the button with appropriate styling based on state."""
+        surface.blits(self.get_blits(), doreturn=False)
     
     def handle_event(self, event):
         """Handle mouse events for button interaction."""
@@ -263,6 +301,9 @@ class TextRenderer:
     Section 3. Typography Specification
     """
     
+    # Number of rendered surfaces kept, least recently used dropped first
+    CACHE_SIZE = 128
+    
     def __init__(self):
         # In a real implementation, you would load pixel fonts here
         self.fonts = {
@@ -271,11 +312,15 @@ class TextRenderer:
             'large': pygame.font.Font(None, 22),
             'title': pygame.font.Font(None, 32)
         }
+        self.cache = OrderedDict()
     
     def render_text(self, text, style='medium', color=SILVER_STEEL, outline=False):
         """
         Render text with optional outline.
         
+        Rendered surfaces are cached and shared between calls, so callers
+        must not draw onto them.
+        
         Args:
             text: String to render
             style: Font style ('small', 'medium', 'large', 'title')
@@ -285,6 +330,19 @@ class TextRenderer:
         Returns:
             pygame.Surface with rendered text
         """
+        key = (text, style, tuple(color), outline)
+        text_surface = self.cache.get(key)
+        if text_surface is None:
+            text_surface = self._render(text, style, color, outline)
+            self.cache[key] = text_surface
+            if len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return text_surface
+    
+    def _render(self, text, style, color, outline):
+        """Render text without consulting the cache."""
         font = self.fonts.get(style, self.fonts['medium'])
         
         if outline:
@@ -295,10 +353,10 @@ class TextRenderer:
             )
             
             # Draw outline in background color
+            outline_text = font.render(text, True, SILVER_STEEL)
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
-                        outline_text = font.render(text, True, SILVER_STEEL)
                         outline_surface.blit(outline_text, (dx + 1, dy + 1))
             
             # Draw main text in center